@@ -51,7 +51,7 @@ from jarvis_mk1_lite.file_processor import (
     FileProcessor,
     UnsupportedFileTypeError,
 )
-from jarvis_mk1_lite.file_sender import FileRequest, FileSender
+from jarvis_mk1_lite.file_sender import FileRequest, FileSender, shutdown_archive_pool
 from jarvis_mk1_lite.metrics import format_metrics_message, metrics, rate_limiter
 from jarvis_mk1_lite.safety import RiskLevel, socratic_gate
 from jarvis_mk1_lite.transcription import (
@@ -94,6 +94,9 @@ def get_file_sender() -> FileSender:
             max_file_size_mb=settings.file_send_max_size_mb,
             compress_large_files=settings.file_send_compress_large,
             temp_dir=settings.file_send_temp_dir,
+            probe_read_access=settings.file_send_probe_read_access,
+            archive_format=settings.file_send_archive_format,
+            compresslevel=settings.file_send_compress_level,
         )
     return _file_sender
 
@@ -859,19 +862,8 @@ async def execute_and_respond(
             else:
                 await send_long_message(message, response.content)
 
-            # Process file requests if any (with DoS protection limit)
+            # Process file requests if any (FileSender caps the count to prevent DoS)
             if file_requests:
-                # Limit number of file requests to prevent abuse
-                from jarvis_mk1_lite.file_sender import MAX_FILE_REQUESTS_PER_RESPONSE
-                if len(file_requests) > MAX_FILE_REQUESTS_PER_RESPONSE:
-                    logger.warning(
-                        "Too many file requests (%d), limiting to %d",
-                        len(file_requests),
-                        MAX_FILE_REQUESTS_PER_RESPONSE,
-                        extra={"user_id": user_id},
-                    )
-                    file_requests = file_requests[:MAX_FILE_REQUESTS_PER_RESPONSE]
-
                 logger.info(
                     "Processing %d file requests",
                     len(file_requests),
@@ -2632,6 +2624,9 @@ async def on_shutdown() -> None:
         await _voice_transcriber.stop()
         logger.info("Telethon client stopped")
 
+    # Stop archive worker processes
+    await asyncio.to_thread(shutdown_archive_pool)
+
     logger.info("Bot shutdown complete")
 
 
@@ -196,6 +196,18 @@ class Settings(BaseSettings):
         default=5,
         description="Number of files before auto-archiving into ZIP",
     )
+    file_send_compress_level: int = Field(
+        default=1,
+        description="DEFLATE level for ZIP compression (1 = fastest, 9 = smallest)",
+    )
+    file_send_archive_format: str = Field(
+        default="zip",
+        description="Format for multi-file archives: zip or tar.zst (needs zstandard)",
+    )
+    file_send_probe_read_access: bool = Field(
+        default=False,
+        description="Check file readability by reading a byte instead of access(2)",
+    )
 
     # Wide Context Settings
     message_accumulation_delay: float = Field(
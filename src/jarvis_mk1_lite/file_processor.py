@@ -11,6 +11,7 @@ The extracted text is passed to Claude Code as part of the message context.
 from __future__ import annotations
 
 import logging
+import sys
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,20 @@ class UnsupportedFileTypeError(FileProcessingError):
     pass
 
 
+def _get_extension(filename: str) -> str:
+    """Get the lowercased, interned extension of a filename.
+
+    Args:
+        filename: Name of the file (with extension).
+
+    Returns:
+        Extension including the leading dot, or empty string if none.
+    """
+    ext = Path(filename).suffix.lower()
+    # Interning empty strings is pointless, they are never a hit
+    return sys.intern(ext) if ext else ext
+
+
 class FileProcessor:
     """Extracts text content from various file formats.
 
@@ -36,9 +51,11 @@ class FileProcessor:
         BINARY_EXTENSIONS: Dict mapping extensions to their handler names.
     """
 
-    # Text-based extensions (direct read with encoding detection)
+    # Text-based extensions (direct read with encoding detection).
+    # Interned so lookups with an interned ``ext`` hit the identity fast path.
     TEXT_EXTENSIONS: frozenset[str] = frozenset(
-        {
+        sys.intern(ext)
+        for ext in (
             ".txt",
             ".md",
             ".py",
@@ -89,12 +106,12 @@ class FileProcessor:
             ".cmake",
             ".gradle",
             ".properties",
-        }
+        )
     )
 
     # Binary formats requiring special handling
     BINARY_EXTENSIONS: dict[str, str] = {
-        ".pdf": "pdf",
+        sys.intern(".pdf"): "pdf",
     }
 
     def __init__(self, max_chars: int = 100000) -> None:
@@ -115,7 +132,7 @@ class FileProcessor:
         Returns:
             True if the file type can be processed.
         """
-        ext = Path(filename).suffix.lower()
+        ext = _get_extension(filename)
         return ext in self.TEXT_EXTENSIONS or ext in self.BINARY_EXTENSIONS
 
     def get_supported_extensions(self) -> list[str]:
@@ -141,7 +158,7 @@ class FileProcessor:
             UnsupportedFileTypeError: If the file type is not supported.
             FileProcessingError: If extraction fails.
         """
-        ext = Path(filename).suffix.lower()
+        ext = _get_extension(filename)
 
         logger.debug(
             "Extracting text from file",
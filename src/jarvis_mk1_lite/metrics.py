@@ -2,39 +2,84 @@
 
 This module provides application metrics, health checks, and observability features.
 Follows KISS principle with simple in-memory counters suitable for single-instance deployment.
-Thread-safe for concurrent async operations using asyncio.Lock.
+Updates are plain synchronous statements with no await in between, so they are
+atomic with respect to other coroutines on the same event loop without a lock.
 """
 
 from __future__ import annotations
 
-import asyncio
+import heapq
 import time
-from collections import OrderedDict
+from collections import ChainMap, deque
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
 
-# Global lock for thread-safe metrics operations
-_metrics_lock: asyncio.Lock | None = None
+# Below this many samples converting to a numpy array costs more than
+# aggregating in pure Python
+NUMPY_MIN_LATENCY_SAMPLES = 512
 
+# numpy module once imported; _numpy_missing remembers a failed import
+_numpy: Any | None = None
+_numpy_missing = False
 
-def _get_metrics_lock() -> asyncio.Lock:
-    """Get or create the global metrics lock.
+
+def _get_numpy() -> Any | None:
+    """Get the numpy module, importing it on first use.
 
     Returns:
-        The asyncio.Lock for metrics operations.
+        The numpy module, or None if it is not installed.
+    """
+    global _numpy, _numpy_missing
+    if _numpy is None and not _numpy_missing:
+        try:
+            import numpy  # type: ignore[import-not-found]
+        except ImportError:
+            _numpy_missing = True
+        else:
+            _numpy = numpy
+    return _numpy
+
+
+# Slots of Metrics._totals
+_TOTAL_REQUESTS = 0
+_TOTAL_COMMANDS = 1
+_TOTAL_MESSAGES = 2
+
+
+def _evict_oldest(counts: dict[int, Any], limit: int) -> None:
+    """Drop the oldest entries of an insertion-ordered dict beyond a limit.
+
+    Args:
+        counts: Dict ordered from least to most recently used.
+        limit: Maximum number of entries to keep.
     """
-    global _metrics_lock
-    if _metrics_lock is None:
-        _metrics_lock = asyncio.Lock()
-    return _metrics_lock
+    overflow = len(counts) - limit
+    if overflow == 1:
+        # Steady state: one new key pushed the dict over the limit
+        del counts[next(iter(counts))]
+    elif overflow > 1:
+        # Limit was lowered; collect the stale keys in one pass
+        for key in list(islice(counts, overflow)):
+            del counts[key]
+
 
+def _merge_shards(shards: tuple[dict[int, int], ...]) -> Mapping[int, int]:
+    """Get a read view over per-user counter shards.
+
+    Args:
+        shards: Shards keyed disjointly by user_id.
 
-def _create_ordered_dict() -> OrderedDict[int, int]:
-    """Factory function for creating OrderedDict with proper typing."""
-    return OrderedDict()
+    Returns:
+        The only shard itself, or a ChainMap over all shards.
+    """
+    if len(shards) == 1:
+        return shards[0]
+    return ChainMap(*shards)
 
 
 @dataclass
@@ -46,42 +91,109 @@ class Metrics:
     User metrics use LRU cache to prevent unbounded memory growth.
     """
 
-    # Request counters
-    total_requests: int = 0
+    # Request counters (requests/commands/messages live in _totals)
     total_errors: int = 0
-    total_commands: int = 0
-    total_messages: int = 0
 
     # Command counters
     command_counts: dict[str, int] = field(default_factory=dict)
 
-    # Per-user counters with LRU eviction
-    user_request_counts: OrderedDict[int, int] = field(default_factory=_create_ordered_dict)
-    user_error_counts: OrderedDict[int, int] = field(default_factory=_create_ordered_dict)
-
     # Maximum number of users to track (LRU eviction when exceeded)
     max_tracked_users: int = 1000
 
+    # Per-user counters are split into this many shards by user_id, each with
+    # its own LRU queue. 1 keeps a single exact LRU over all users.
+    user_shards: int = 1
+
     # Safety counters
     safety_checks: int = 0
     blocked_dangerous: int = 0
     blocked_critical: int = 0
 
     # Latency tracking (last 100 requests)
-    latencies: list[float] = field(default_factory=list)
+    latencies: deque[float] = field(default_factory=deque)
     max_latency_samples: int = 100
 
     # Timestamps
     start_time: float = field(default_factory=time.time)
     last_request_time: float | None = None
 
-    def _evict_lru_users(self) -> None:
-        """Evict least recently used users if over capacity."""
-        while len(self.user_request_counts) > self.max_tracked_users:
-            # Remove oldest (first) entry
-            self.user_request_counts.popitem(last=False)
-        while len(self.user_error_counts) > self.max_tracked_users:
-            self.user_error_counts.popitem(last=False)
+    # Per-user LRU shards (plain dicts keep insertion order, so the first key
+    # is always the least recently used one)
+    _request_shards: tuple[dict[int, int], ...] = field(init=False, repr=False)
+    _error_shards: tuple[dict[int, int], ...] = field(init=False, repr=False)
+
+    # [requests, commands, messages], indexed by the _TOTAL_* constants
+    _totals: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Bound the latency window and create the per-user shards and totals.
+
+        Raises:
+            ValueError: If user_shards is less than 1.
+        """
+        self.latencies = deque(self.latencies, maxlen=self.max_latency_samples)
+        if self.user_shards < 1:
+            raise ValueError(f"user_shards must be at least 1, got {self.user_shards}")
+        self._request_shards = tuple({} for _ in range(self.user_shards))
+        self._error_shards = tuple({} for _ in range(self.user_shards))
+        self._totals = [0, 0, 0]
+
+    @property
+    def total_requests(self) -> int:
+        """Total number of requests."""
+        return self._totals[_TOTAL_REQUESTS]
+
+    @total_requests.setter
+    def total_requests(self, value: int) -> None:
+        self._totals[_TOTAL_REQUESTS] = value
+
+    @property
+    def total_commands(self) -> int:
+        """Number of requests that were commands."""
+        return self._totals[_TOTAL_COMMANDS]
+
+    @total_commands.setter
+    def total_commands(self, value: int) -> None:
+        self._totals[_TOTAL_COMMANDS] = value
+
+    @property
+    def total_messages(self) -> int:
+        """Number of requests that were regular messages."""
+        return self._totals[_TOTAL_MESSAGES]
+
+    @total_messages.setter
+    def total_messages(self, value: int) -> None:
+        self._totals[_TOTAL_MESSAGES] = value
+
+    @property
+    def user_request_counts(self) -> Mapping[int, int]:
+        """Per-user request counts across all shards."""
+        return _merge_shards(self._request_shards)
+
+    @property
+    def user_error_counts(self) -> Mapping[int, int]:
+        """Per-user error counts across all shards."""
+        return _merge_shards(self._error_shards)
+
+    def get_active_users(self) -> int:
+        """Get the number of users with tracked requests.
+
+        Returns:
+            Number of users across all request shards.
+        """
+        return sum(len(shard) for shard in self._request_shards)
+
+    def _bump_user(self, shards: tuple[dict[int, int], ...], user_id: int) -> None:
+        """Increment a user's counter and evict least recently used users.
+
+        Args:
+            shards: Request or error shards to update.
+            user_id: Telegram user ID.
+        """
+        counts = shards[user_id % len(shards)]
+        # pop + reinsert moves the key to the tail (most recently used)
+        counts[user_id] = counts.pop(user_id, 0) + 1
+        _evict_oldest(counts, max(1, self.max_tracked_users // len(shards)))
 
     def record_request(self, user_id: int, is_command: bool = False) -> None:
         """Record a request from a user (synchronous version).
@@ -90,29 +202,23 @@ class Metrics:
             user_id: Telegram user ID.
             is_command: Whether the request is a command (vs regular message).
         """
-        self.total_requests += 1
+        totals = self._totals
+        totals[_TOTAL_REQUESTS] += 1
+        # Commands sit right before messages, so the bool selects the slot
+        totals[_TOTAL_MESSAGES - is_command] += 1
 
-        # Update user count with LRU behavior (move to end)
-        count = self.user_request_counts.pop(user_id, 0) + 1
-        self.user_request_counts[user_id] = count
-        self._evict_lru_users()
+        self._bump_user(self._request_shards, user_id)
 
         self.last_request_time = time.time()
 
-        if is_command:
-            self.total_commands += 1
-        else:
-            self.total_messages += 1
-
     async def record_request_async(self, user_id: int, is_command: bool = False) -> None:
-        """Record a request from a user (async thread-safe version).
+        """Record a request from a user (async version).
 
         Args:
             user_id: Telegram user ID.
             is_command: Whether the request is a command (vs regular message).
         """
-        async with _get_metrics_lock():
-            self.record_request(user_id, is_command)
+        self.record_request(user_id, is_command)
 
     def record_command(self, command: str, user_id: int) -> None:
         """Record a specific command usage.
@@ -132,19 +238,15 @@ class Metrics:
         """
         self.total_errors += 1
 
-        # Update error count with LRU behavior (move to end)
-        count = self.user_error_counts.pop(user_id, 0) + 1
-        self.user_error_counts[user_id] = count
-        self._evict_lru_users()
+        self._bump_user(self._error_shards, user_id)
 
     async def record_error_async(self, user_id: int) -> None:
-        """Record an error for a user (async thread-safe version).
+        """Record an error for a user (async version).
 
         Args:
             user_id: Telegram user ID.
         """
-        async with _get_metrics_lock():
-            self.record_error(user_id)
+        self.record_error(user_id)
 
     def record_latency(self, latency: float) -> None:
         """Record request latency (synchronous version).
@@ -152,19 +254,19 @@ class Metrics:
         Args:
             latency: Latency in seconds.
         """
+        # The deque drops the oldest sample itself once full; it is only
+        # rebuilt if max_latency_samples was changed after construction.
+        if self.latencies.maxlen != self.max_latency_samples:
+            self.latencies = deque(self.latencies, maxlen=self.max_latency_samples)
         self.latencies.append(latency)
-        # Keep only last N samples
-        if len(self.latencies) > self.max_latency_samples:
-            self.latencies = self.latencies[-self.max_latency_samples :]
 
     async def record_latency_async(self, latency: float) -> None:
-        """Record request latency (async thread-safe version).
+        """Record request latency (async version).
 
         Args:
             latency: Latency in seconds.
         """
-        async with _get_metrics_lock():
-            self.record_latency(latency)
+        self.record_latency(latency)
 
     def record_safety_check(self, is_dangerous: bool = False, is_critical: bool = False) -> None:
         """Record a safety check result.
@@ -187,6 +289,20 @@ class Metrics:
         """
         return time.time() - self.start_time
 
+    def _latency_array(self) -> Any | None:
+        """Get the latency samples as a numpy array for large windows.
+
+        Returns:
+            A float64 array, or None if numpy is not installed or the window is
+            small enough that the pure-Python path is faster.
+        """
+        if len(self.latencies) < NUMPY_MIN_LATENCY_SAMPLES:
+            return None
+        np = _get_numpy()
+        if np is None:
+            return None
+        return np.fromiter(self.latencies, dtype=np.float64, count=len(self.latencies))
+
     def get_average_latency(self) -> float:
         """Get average request latency.
 
@@ -195,6 +311,9 @@ class Metrics:
         """
         if not self.latencies:
             return 0.0
+        arr = self._latency_array()
+        if arr is not None:
+            return float(arr.mean())
         return sum(self.latencies) / len(self.latencies)
 
     def get_p95_latency(self) -> float:
@@ -203,11 +322,27 @@ class Metrics:
         Returns:
             P95 latency in seconds, or 0.0 if no samples.
         """
-        if not self.latencies:
-            return 0.0
-        sorted_latencies = sorted(self.latencies)
-        idx = int(len(sorted_latencies) * 0.95)
-        return sorted_latencies[min(idx, len(sorted_latencies) - 1)]
+        return self._latency_stats()[1]
+
+    def _latency_stats(self) -> tuple[float, float]:
+        """Compute average and P95 latency in a single pass over the samples.
+
+        Returns:
+            Tuple of (average, p95) in seconds, or (0.0, 0.0) if no samples.
+        """
+        n = len(self.latencies)
+        if n == 0:
+            return 0.0, 0.0
+        idx = min(int(n * 0.95), n - 1)
+        arr = self._latency_array()
+        if arr is not None:
+            avg = float(arr.mean())
+            # Selection instead of a full sort; same nearest-rank index
+            arr.partition(idx)
+            return avg, float(arr[idx])
+        # Only the top n - idx samples are needed, so skip the full sort
+        p95 = heapq.nlargest(n - idx, self.latencies)[-1]
+        return sum(self.latencies) / n, p95
 
     def get_error_rate(self) -> float:
         """Get error rate as percentage.
@@ -226,10 +361,9 @@ class Metrics:
             Formatted uptime string (e.g., "1d 2h 30m 15s").
         """
         uptime = int(self.get_uptime())
-        days = uptime // 86400
-        hours = (uptime % 86400) // 3600
-        minutes = (uptime % 3600) // 60
-        seconds = uptime % 60
+        days, rem = divmod(uptime, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
 
         parts = []
         if days > 0:
@@ -244,13 +378,11 @@ class Metrics:
 
     def reset(self) -> None:
         """Reset all metrics to initial values."""
-        self.total_requests = 0
+        self._totals[:] = (0, 0, 0)
         self.total_errors = 0
-        self.total_commands = 0
-        self.total_messages = 0
         self.command_counts.clear()
-        self.user_request_counts.clear()
-        self.user_error_counts.clear()
+        for shard in (*self._request_shards, *self._error_shards):
+            shard.clear()
         self.safety_checks = 0
         self.blocked_dangerous = 0
         self.blocked_critical = 0
@@ -282,6 +414,7 @@ class RateLimiter:
 
     Limits requests per user using a token bucket algorithm.
     Each user gets a bucket that refills over time.
+    Buckets use LRU eviction to prevent unbounded memory growth.
     """
 
     # Maximum tokens per bucket
@@ -290,40 +423,45 @@ class RateLimiter:
     # Refill rate (tokens per second)
     refill_rate: float = 0.5
 
-    # User buckets: user_id -> (tokens, last_update_time)
+    # User buckets: user_id -> (tokens, last_update_monotonic), least recently
+    # used first (plain dicts keep insertion order)
     buckets: dict[int, tuple[float, float]] = field(default_factory=dict)
 
-    def _get_bucket(self, user_id: int) -> tuple[float, float]:
-        """Get or create a bucket for a user.
+    # Maximum number of buckets to keep (LRU eviction when exceeded). An
+    # evicted user simply starts again with a full bucket.
+    max_buckets: int = 10000
 
-        Args:
-            user_id: Telegram user ID.
+    def _refill(self, user_id: int) -> tuple[float, float]:
+        """Take a user's bucket out and refill it up to now.
 
-        Returns:
-            Tuple of (current_tokens, last_update_time).
-        """
-        if user_id not in self.buckets:
-            self.buckets[user_id] = (float(self.max_tokens), time.time())
-        return self.buckets[user_id]
-
-    def _refill_bucket(self, user_id: int) -> float:
-        """Refill a user's bucket based on time elapsed.
+        A missing bucket counts as full. Callers write the bucket back with
+        _store(), which reinserts it as the most recently used.
 
         Args:
             user_id: Telegram user ID.
 
         Returns:
-            Current token count after refill.
+            Tuple of (current_tokens, now).
         """
-        tokens, last_update = self._get_bucket(user_id)
-        now = time.time()
-        elapsed = now - last_update
+        now = time.monotonic()
+        bucket = self.buckets.pop(user_id, None)
+        if bucket is None:
+            return float(self.max_tokens), now
 
+        tokens, last_update = bucket
         # Add tokens based on elapsed time
-        new_tokens = min(self.max_tokens, tokens + elapsed * self.refill_rate)
-        self.buckets[user_id] = (new_tokens, now)
+        return min(self.max_tokens, tokens + (now - last_update) * self.refill_rate), now
+
+    def _store(self, user_id: int, tokens: float, now: float) -> None:
+        """Store a user's bucket and evict the least recently used if over capacity.
 
-        return new_tokens
+        Args:
+            user_id: Telegram user ID.
+            tokens: Token count to store.
+            now: Time of the update.
+        """
+        self.buckets[user_id] = (tokens, now)
+        _evict_oldest(self.buckets, self.max_buckets)
 
     def is_allowed(self, user_id: int, cost: float = 1.0) -> bool:
         """Check if a request is allowed and consume tokens.
@@ -335,14 +473,14 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited.
         """
-        tokens = self._refill_bucket(user_id)
+        tokens, now = self._refill(user_id)
 
         if tokens >= cost:
             # Consume tokens
-            _, last_update = self.buckets[user_id]
-            self.buckets[user_id] = (tokens - cost, last_update)
+            self._store(user_id, tokens - cost, now)
             return True
 
+        self._store(user_id, tokens, now)
         return False
 
     def get_remaining(self, user_id: int) -> float:
@@ -354,7 +492,9 @@ class RateLimiter:
         Returns:
             Number of tokens remaining.
         """
-        return self._refill_bucket(user_id)
+        tokens, now = self._refill(user_id)
+        self._store(user_id, tokens, now)
+        return tokens
 
     def get_retry_after(self, user_id: int, cost: float = 1.0) -> float:
         """Get seconds until next request will be allowed.
@@ -366,7 +506,8 @@ class RateLimiter:
         Returns:
             Seconds until request will be allowed, or 0 if already allowed.
         """
-        tokens = self._refill_bucket(user_id)
+        tokens, now = self._refill(user_id)
+        self._store(user_id, tokens, now)
 
         if tokens >= cost:
             return 0.0
@@ -381,7 +522,8 @@ class RateLimiter:
         Args:
             user_id: Telegram user ID.
         """
-        self.buckets[user_id] = (float(self.max_tokens), time.time())
+        self.buckets.pop(user_id, None)
+        self._store(user_id, float(self.max_tokens), time.monotonic())
 
     def reset_all(self) -> None:
         """Reset all user buckets."""
@@ -392,6 +534,10 @@ class RateLimiter:
 metrics = Metrics()
 rate_limiter = RateLimiter()
 
+# Last rendered metrics message, keyed by a snapshot of the counters it shows
+# and the current one-second bucket (the finest unit of the uptime display)
+_metrics_message_cache: tuple[tuple[Any, ...], str] | None = None
+
 
 def get_health_status(claude_healthy: bool | None = None) -> HealthStatus:
     """Get current application health status.
@@ -423,31 +569,63 @@ def format_metrics_message(session_stats: dict[str, int | float | None] | None =
     Returns:
         Formatted metrics string for Telegram.
     """
-    health = get_health_status()
-
-    # Build base metrics message
-    message = f"""*Application Metrics*
+    global _metrics_message_cache
+    key = (
+        int(time.monotonic()),
+        metrics.start_time,
+        metrics.total_requests,
+        metrics.total_errors,
+        metrics.total_commands,
+        metrics.safety_checks,
+        metrics.blocked_dangerous,
+        metrics.blocked_critical,
+        tuple(session_stats.items()) if session_stats is not None else None,
+    )
+    if _metrics_message_cache is not None and _metrics_message_cache[0] == key:
+        return _metrics_message_cache[1]
 
-*Status:* {"+" if health.healthy else "-"} {health.status.upper()}
-*Uptime:* `{health.uptime_formatted}`
+    message = _render_metrics_message(session_stats)
+    _metrics_message_cache = (key, message)
+    return message
 
-*Requests:*
-- Total: `{metrics.total_requests}`
-- Commands: `{metrics.total_commands}`
-- Messages: `{metrics.total_messages}`
-- Errors: `{metrics.total_errors}`
-- Error Rate: `{health.error_rate:.1f}%`
 
-*Latency:*
-- Average: `{metrics.get_average_latency()*1000:.0f}ms`
-- P95: `{metrics.get_p95_latency()*1000:.0f}ms`
+def _render_metrics_message(session_stats: dict[str, int | float | None] | None) -> str:
+    """Render the metrics message without caching.
 
-*Safety:*
-- Total Checks: `{metrics.safety_checks}`
-- Blocked Dangerous: `{metrics.blocked_dangerous}`
-- Blocked Critical: `{metrics.blocked_critical}`
+    Args:
+        session_stats: Optional session statistics from ClaudeBridge.get_session_stats().
 
-*Active Users:* `{len(metrics.user_request_counts)}`"""
+    Returns:
+        Formatted metrics string for Telegram.
+    """
+    health = get_health_status()
+    avg_latency, p95_latency = metrics._latency_stats()
+
+    # Build base metrics message as lines joined once at the end
+    lines = [
+        "*Application Metrics*",
+        "",
+        f"*Status:* {'+' if health.healthy else '-'} {health.status.upper()}",
+        f"*Uptime:* `{health.uptime_formatted}`",
+        "",
+        "*Requests:*",
+        f"- Total: `{metrics.total_requests}`",
+        f"- Commands: `{metrics.total_commands}`",
+        f"- Messages: `{metrics.total_messages}`",
+        f"- Errors: `{metrics.total_errors}`",
+        f"- Error Rate: `{health.error_rate:.1f}%`",
+        "",
+        "*Latency:*",
+        f"- Average: `{avg_latency*1000:.0f}ms`",
+        f"- P95: `{p95_latency*1000:.0f}ms`",
+        "",
+        "*Safety:*",
+        f"- Total Checks: `{metrics.safety_checks}`",
+        f"- Blocked Dangerous: `{metrics.blocked_dangerous}`",
+        f"- Blocked Critical: `{metrics.blocked_critical}`",
+        "",
+        f"*Active Users:* `{metrics.get_active_users()}`",
+    ]
 
     # Add session statistics if provided
     if session_stats is not None:
@@ -456,11 +634,14 @@ def format_metrics_message(session_stats: dict[str, int | float | None] | None =
         evicted = session_stats.get("sessions_evicted", 0)
         oldest_age = session_stats.get("oldest_session_age")
 
-        message += "\n\n*Sessions:*"
-        message += f"\n- Active: `{active}`"
-        message += f"\n- Expired: `{expired}`"
-        message += f"\n- Evicted: `{evicted}`"
+        lines += [
+            "",
+            "*Sessions:*",
+            f"- Active: `{active}`",
+            f"- Expired: `{expired}`",
+            f"- Evicted: `{evicted}`",
+        ]
         if oldest_age is not None:
-            message += f"\n- Oldest: `{oldest_age:.0f}s`"
+            lines.append(f"- Oldest: `{oldest_age:.0f}s`")
 
-    return message
+    return "\n".join(lines)
@@ -7,6 +7,7 @@ and requires appropriate confirmation for dangerous operations.
 import re
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 
 class RiskLevel(Enum):
@@ -85,6 +86,87 @@ MODERATE_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
+def _compile_regex(pattern: str) -> Any:
+    """Compile a case-insensitive regex, preferring RE2 when installed.
+
+    RE2 matches in linear time, so a long message cannot make the gate
+    backtrack. Falls back to the stdlib engine if google-re2 is missing or
+    rejects the pattern.
+
+    Args:
+        pattern: Regular expression source.
+
+    Returns:
+        Compiled pattern exposing the re.Pattern search API.
+    """
+    try:
+        import re2  # type: ignore[import-not-found]
+    except ImportError:
+        return re.compile(pattern, re.IGNORECASE)
+
+    try:
+        return re2.compile(f"(?i){pattern}")
+    except re2.error:
+        return re.compile(pattern, re.IGNORECASE)
+
+
+def _compile_tier(patterns: list[tuple[str, str]], prefix: str) -> tuple[Any, dict[str, str]]:
+    """Compile a risk tier into a single alternation regex.
+
+    Each pattern is wrapped in its own named group so one search covers the
+    whole tier and the matching group name identifies the description.
+
+    Args:
+        patterns: List of (regex, description) tuples.
+        prefix: Group name prefix unique to the tier.
+
+    Returns:
+        Tuple of (compiled case-insensitive regex, group name -> description).
+    """
+    descriptions = {f"{prefix}{i}": description for i, (_, description) in enumerate(patterns)}
+    combined = "|".join(f"(?P<{prefix}{i}>{pattern})" for i, (pattern, _) in enumerate(patterns))
+    return _compile_regex(combined), descriptions
+
+
+# Compiled (critical, dangerous, moderate) tiers, built on first check
+_compiled_tiers: tuple[tuple[Any, dict[str, str]], ...] | None = None
+
+
+def _get_compiled_tiers() -> tuple[tuple[Any, dict[str, str]], ...]:
+    """Get or compile the risk tiers.
+
+    Returns:
+        Tuple of (regex, descriptions) pairs for the critical, dangerous and
+        moderate tiers, in that order.
+    """
+    global _compiled_tiers
+    if _compiled_tiers is None:
+        _compiled_tiers = (
+            _compile_tier(CRITICAL_PATTERNS, "c"),
+            _compile_tier(DANGEROUS_PATTERNS, "d"),
+            _compile_tier(MODERATE_PATTERNS, "m"),
+        )
+    return _compiled_tiers
+
+
+def _match_tier(tier: tuple[Any, dict[str, str]], message: str) -> str | None:
+    """Find the pattern of a tier that matches a message.
+
+    Args:
+        tier: Compiled (regex, descriptions) pair from _compile_tier().
+        message: The message/command to check.
+
+    Returns:
+        Description of the matched pattern, or None if nothing matched.
+    """
+    regex, descriptions = tier
+    match = regex.search(message)
+    if match is None:
+        return None
+    # The wrapping named group closes last, so lastgroup names the pattern
+    return descriptions[match.lastgroup]
+
+
 class SocraticGate:
     """Security gate that checks commands for dangerous patterns.
 
@@ -108,37 +190,37 @@ class SocraticGate:
         Returns:
             SafetyCheck with risk level and confirmation requirements.
         """
-        text = message.lower()
+        critical, dangerous, moderate = _get_compiled_tiers()
 
         # Check CRITICAL patterns first (highest priority)
-        for pattern, description in CRITICAL_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return SafetyCheck(
-                    risk_level=RiskLevel.CRITICAL,
-                    requires_confirmation=True,
-                    message=self._critical_message(description),
-                    matched_pattern=description,
-                )
+        description = _match_tier(critical, message)
+        if description is not None:
+            return SafetyCheck(
+                risk_level=RiskLevel.CRITICAL,
+                requires_confirmation=True,
+                message=self._critical_message(description),
+                matched_pattern=description,
+            )
 
         # Check DANGEROUS patterns second
-        for pattern, description in DANGEROUS_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return SafetyCheck(
-                    risk_level=RiskLevel.DANGEROUS,
-                    requires_confirmation=True,
-                    message=self._dangerous_message(description),
-                    matched_pattern=description,
-                )
+        description = _match_tier(dangerous, message)
+        if description is not None:
+            return SafetyCheck(
+                risk_level=RiskLevel.DANGEROUS,
+                requires_confirmation=True,
+                message=self._dangerous_message(description),
+                matched_pattern=description,
+            )
 
         # Check MODERATE patterns third
-        for pattern, description in MODERATE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return SafetyCheck(
-                    risk_level=RiskLevel.MODERATE,
-                    requires_confirmation=False,
-                    message=self._moderate_message(description),
-                    matched_pattern=description,
-                )
+        description = _match_tier(moderate, message)
+        if description is not None:
+            return SafetyCheck(
+                risk_level=RiskLevel.MODERATE,
+                requires_confirmation=False,
+                message=self._moderate_message(description),
+                matched_pattern=description,
+            )
 
         # No dangerous patterns found
         return SafetyCheck(
@@ -12,7 +12,14 @@ Note:
 """
 
 import asyncio
+import functools
 import logging
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -22,6 +29,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pending transcriptions are polled with exponential backoff: the interval grows
+# by POLL_BACKOFF_FACTOR per attempt up to POLL_MAX_INTERVAL, plus up to
+# POLL_JITTER * poll_interval of random jitter so concurrent polls spread out
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_INTERVAL = 5.0
+POLL_JITTER = 0.2
+
+# Voice files smaller than this cannot hold any audio Telegram would transcribe
+MIN_VOICE_DATA_BYTES = 128
+
 # Error patterns that Telegram may return in transcription text instead of raising exception
 TRANSCRIPTION_ERROR_PATTERNS = [
     "error during transcription",
@@ -33,6 +50,37 @@ TRANSCRIPTION_ERROR_PATTERNS = [
     "failed to transcribe",
 ]
 
+# All error patterns as one case-insensitive alternation, scanned in a single pass
+_ERROR_TEXT_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in TRANSCRIPTION_ERROR_PATTERNS), re.IGNORECASE
+)
+
+# Aho-Corasick automaton over the lowercased patterns when pyahocorasick is
+# installed; _error_automaton_missing remembers a failed import
+_error_automaton: Any | None = None
+_error_automaton_missing = False
+
+
+def _get_error_automaton() -> Any | None:
+    """Get the error pattern automaton, building it on first use.
+
+    Returns:
+        A pyahocorasick Automaton, or None if pyahocorasick is not installed.
+    """
+    global _error_automaton, _error_automaton_missing
+    if _error_automaton is None and not _error_automaton_missing:
+        try:
+            import ahocorasick  # type: ignore[import-not-found]
+        except ImportError:
+            _error_automaton_missing = True
+        else:
+            automaton = ahocorasick.Automaton()
+            for pattern in TRANSCRIPTION_ERROR_PATTERNS:
+                automaton.add_word(pattern.lower(), pattern)
+            automaton.make_automaton()
+            _error_automaton = automaton
+    return _error_automaton
+
 
 def _is_error_text(text: str) -> bool:
     """Check if transcription result text is actually an error message.
@@ -49,8 +97,56 @@ def _is_error_text(text: str) -> bool:
     if not text:
         return True  # Empty text is an error
 
-    text_lower = text.lower().strip()
-    return any(pattern in text_lower for pattern in TRANSCRIPTION_ERROR_PATTERNS)
+    automaton = _get_error_automaton()
+    if automaton is not None:
+        return next(automaton.iter(text.lower()), None) is not None
+    return _ERROR_TEXT_RE.search(text) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class _TelethonApi:
+    """Telethon names used on the transcription hot path, resolved once."""
+
+    FloodWaitError: type[Any]
+    MessageIdInvalidError: type[Any]
+    PremiumAccountRequiredError: type[Any]
+    TranscribeAudioRequest: Any
+    DocumentAttributeAudio: Any
+
+
+# Telethon API (lazy loaded, telethon is an optional dependency)
+_telethon: _TelethonApi | None = None
+
+
+def _get_telethon() -> _TelethonApi:
+    """Get the Telethon names used for transcription, importing them on first use.
+
+    Returns:
+        _TelethonApi with the error classes and request/attribute types.
+
+    Raises:
+        ImportError: If telethon is not installed.
+    """
+    global _telethon
+    if _telethon is None:
+        try:
+            from telethon.errors import (  # type: ignore[import-untyped]
+                FloodWaitError,
+                MessageIdInvalidError,
+                PremiumAccountRequiredError,
+            )
+            from telethon.tl import functions, types  # type: ignore[import-untyped]
+        except ImportError as e:
+            raise ImportError("telethon is required for voice transcription.") from e
+
+        _telethon = _TelethonApi(
+            FloodWaitError=FloodWaitError,
+            MessageIdInvalidError=MessageIdInvalidError,
+            PremiumAccountRequiredError=PremiumAccountRequiredError,
+            TranscribeAudioRequest=functions.messages.TranscribeAudioRequest,
+            DocumentAttributeAudio=types.DocumentAttributeAudio,
+        )
+    return _telethon
 
 
 class TranscriptionError(Exception):
@@ -107,6 +203,9 @@ class VoiceTranscriber:
         api_hash: str,
         phone: str,
         session_name: str = "jarvis_premium",
+        cache_size: int = 512,
+        cache_ttl: float = 3600.0,
+        cache_db_path: str | Path | None = None,
     ) -> None:
         """Initialize VoiceTranscriber.
 
@@ -115,13 +214,36 @@ class VoiceTranscriber:
             api_hash: Telegram API hash from my.telegram.org.
             phone: Phone number with country code (e.g., +79001234567).
             session_name: Name for the session file.
+            cache_size: Maximum number of transcriptions kept in memory.
+            cache_ttl: Seconds a cached transcription stays valid.
+            cache_db_path: Optional SQLite file that persists cached transcriptions
+                across restarts, behind the in-memory cache.
         """
         self.api_id = api_id
         self.api_hash = api_hash
         self.phone = phone
         self.session_name = session_name
+        self._session_path = Path(f"{session_name}.session")
+        # Only a positive stat is cached; a missing file is re-checked every call
+        self._session_exists_cache: bool | None = None
         self._client: TelegramClient | None = None
         self._started = False
+        # Kept connected between is_authorized() calls until start() or stop()
+        self._probe_client: TelegramClient | None = None
+        self._probe_lock = asyncio.Lock()
+        # (peer, msg_id) -> (result, monotonic time cached), LRU order
+        self._cache: OrderedDict[tuple[str, int], tuple[TranscriptionResult, float]] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cache_db_path = cache_db_path
+        self._cache_db: sqlite3.Connection | None = None
+        self._cache_db_lock = threading.Lock()
+        # (peer, msg_id) -> running request, shared by concurrent callers
+        self._inflight: dict[tuple[str, int], asyncio.Task[TranscriptionResult]] = {}
+        # Background deletes of uploaded voice files, drained in stop()
+        self._pending_cleanup: set[asyncio.Task[None]] = set()
+        # Voice attributes for uploads of unknown duration, built on first use
+        self._default_voice_attrs: list[Any] | None = None
 
     @property
     def is_started(self) -> bool:
@@ -131,20 +253,28 @@ class VoiceTranscriber:
     @property
     def session_file_path(self) -> Path:
         """Get the path to the session file."""
-        return Path(f"{self.session_name}.session")
+        return self._session_path
 
     def session_exists(self) -> bool:
         """Check if the session file exists.
 
+        Once found, the file is assumed to stay until is_authorized() fails.
+
         Returns:
             True if session file exists, False otherwise.
         """
-        return self.session_file_path.exists()
+        if self._session_exists_cache is None:
+            if not self._session_path.exists():
+                return False
+            self._session_exists_cache = True
+        return self._session_exists_cache
 
     async def is_authorized(self) -> bool:
         """Check if the Telethon client is authorized.
 
-        This connects to Telegram and checks if the session is valid.
+        Uses the main client once started. Otherwise a probe client is
+        connected on first use and kept for later calls, so repeated checks
+        skip the MTProto handshake.
 
         Returns:
             True if authorized, False otherwise.
@@ -163,15 +293,39 @@ class VoiceTranscriber:
         if not self.session_exists():
             return False
 
-        client = TelegramClient(self.session_name, self.api_id, self.api_hash)
+        if self._client is not None and self._started:
+            try:
+                authorized = bool(await self._client.is_user_authorized())
+            except Exception as e:
+                logger.warning(f"Failed to check authorization: {e}")
+                authorized = False
+        else:
+            async with self._probe_lock:
+                try:
+                    if self._probe_client is None:
+                        client = TelegramClient(self.session_name, self.api_id, self.api_hash)
+                        await client.connect()
+                        self._probe_client = client
+                    authorized = bool(await self._probe_client.is_user_authorized())
+                except Exception as e:
+                    logger.warning(f"Failed to check authorization: {e}")
+                    await self._close_probe_client()
+                    authorized = False
+
+        if not authorized:
+            # The session file may have been removed; stat it again next time
+            self._session_exists_cache = None
+        return authorized
+
+    async def _close_probe_client(self) -> None:
+        """Disconnect and drop the is_authorized() probe client, if any."""
+        client, self._probe_client = self._probe_client, None
+        if client is None:
+            return
         try:
-            await client.connect()
-            authorized = await client.is_user_authorized()
             await client.disconnect()
-            return bool(authorized)
         except Exception as e:
-            logger.warning(f"Failed to check authorization: {e}")
-            return False
+            logger.warning(f"Error during probe disconnect: {e}")
 
     async def start(self) -> None:
         """Start the Telethon client and authenticate.
@@ -195,11 +349,17 @@ class VoiceTranscriber:
                 "Install it with: pip install telethon"
             ) from e
 
+        # The probe client holds the same session file open
+        async with self._probe_lock:
+            await self._close_probe_client()
+
         self._client = TelegramClient(self.session_name, self.api_id, self.api_hash)
 
         try:
             await self._client.start(phone=self.phone)
             self._started = True
+            # A successful start leaves a session file behind
+            self._session_exists_cache = True
             logger.info("VoiceTranscriber started successfully")
         except Exception as e:
             logger.error(f"Failed to start VoiceTranscriber: {e}")
@@ -210,6 +370,9 @@ class VoiceTranscriber:
 
         Handles disconnect errors gracefully to ensure cleanup.
         """
+        if self._pending_cleanup:
+            await asyncio.gather(*self._pending_cleanup, return_exceptions=True)
+
         if self._client:
             try:
                 await self._client.disconnect()
@@ -220,12 +383,149 @@ class VoiceTranscriber:
                 self._started = False
                 logger.info("VoiceTranscriber stopped")
 
+        async with self._probe_lock:
+            await self._close_probe_client()
+
+        if self._cache_db is not None:
+            with self._cache_db_lock:
+                self._cache_db.close()
+                self._cache_db = None
+
+    def _get_cached(self, key: tuple[str, int]) -> TranscriptionResult | None:
+        """Get a cached transcription if it has not expired.
+
+        Args:
+            key: (peer, msg_id) cache key.
+
+        Returns:
+            Cached TranscriptionResult, or None on miss or expiry.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        result, cached_at = entry
+        if time.monotonic() - cached_at >= self._cache_ttl:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return result
+
+    def _store_cached(self, key: tuple[str, int], result: TranscriptionResult) -> None:
+        """Cache a transcription, evicting the least recently used if full.
+
+        Args:
+            key: (peer, msg_id) cache key.
+            result: Completed transcription to cache.
+        """
+        self._cache[key] = (result, time.monotonic())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _get_cache_db(self) -> sqlite3.Connection:
+        """Get or open the persistent cache database.
+
+        Must be called with _cache_db_lock held.
+
+        Returns:
+            Open SQLite connection with the transcriptions table created.
+        """
+        if self._cache_db is None:
+            assert self._cache_db_path is not None
+            conn = sqlite3.connect(self._cache_db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcriptions ("
+                "peer TEXT NOT NULL, msg_id INTEGER NOT NULL, text TEXT NOT NULL, "
+                "transcription_id INTEGER NOT NULL, trial_remains INTEGER, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (peer, msg_id))"
+            )
+            self._cache_db = conn
+        return self._cache_db
+
+    def _load_persisted_sync(self, key: tuple[str, int]) -> TranscriptionResult | None:
+        """Load an unexpired transcription from the persistent cache.
+
+        Args:
+            key: (peer, msg_id) cache key.
+
+        Returns:
+            Persisted TranscriptionResult, or None on miss, expiry or error.
+        """
+        try:
+            with self._cache_db_lock:
+                row = (
+                    self._get_cache_db()
+                    .execute(
+                        "SELECT text, transcription_id, trial_remains FROM transcriptions "
+                        "WHERE peer = ? AND msg_id = ? AND expires_at > ?",
+                        (*key, time.time()),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read transcription cache: {e}")
+            return None
+
+        if row is None:
+            return None
+        text, transcription_id, trial_remains = row
+        return TranscriptionResult(
+            text=text, transcription_id=transcription_id, trial_remains=trial_remains
+        )
+
+    def _persist_sync(self, key: tuple[str, int], result: TranscriptionResult) -> None:
+        """Write a transcription to the persistent cache and purge expired rows.
+
+        Args:
+            key: (peer, msg_id) cache key.
+            result: Completed transcription to persist.
+        """
+        # Wall-clock expiry, since monotonic time does not survive a restart
+        now = time.time()
+        try:
+            with self._cache_db_lock:
+                db = self._get_cache_db()
+                with db:
+                    db.execute("DELETE FROM transcriptions WHERE expires_at <= ?", (now,))
+                    db.execute(
+                        "INSERT OR REPLACE INTO transcriptions VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            *key,
+                            result.text,
+                            result.transcription_id,
+                            result.trial_remains,
+                            now + self._cache_ttl,
+                        ),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write transcription cache: {e}")
+
+    def invalidate(self, peer: int | str, msg_id: int) -> None:
+        """Drop a cached transcription, e.g. after the message was edited or deleted.
+
+        Args:
+            peer: Chat/user ID or username where the voice message is.
+            msg_id: Message ID of the voice message.
+        """
+        key = (str(peer), msg_id)
+        self._cache.pop(key, None)
+        if self._cache_db_path is not None:
+            try:
+                with self._cache_db_lock:
+                    db = self._get_cache_db()
+                    with db:
+                        db.execute("DELETE FROM transcriptions WHERE peer = ? AND msg_id = ?", key)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to invalidate transcription cache: {e}")
+
     async def transcribe_voice(
         self,
         peer: int | str,
         msg_id: int,
         timeout: float = 30.0,
-        poll_interval: float = 1.0,
+        poll_interval: float = 0.3,
     ) -> TranscriptionResult:
         """Transcribe a voice message using Telegram Premium API.
 
@@ -233,10 +533,12 @@ class VoiceTranscriber:
             peer: Chat/user ID or username where the voice message is.
             msg_id: Message ID of the voice message.
             timeout: Maximum time to wait for transcription (seconds).
-            poll_interval: Interval between polling for pending results.
+            poll_interval: Initial interval between polls for pending results.
 
         Returns:
-            TranscriptionResult with transcribed text.
+            TranscriptionResult with transcribed text. Repeated calls for the same
+            message within the cache TTL return the cached result, and concurrent
+            calls share a single request.
 
         Raises:
             TranscriptionError: If transcriber is not started.
@@ -246,20 +548,74 @@ class VoiceTranscriber:
         if not self._client or not self._started:
             raise TranscriptionError("Transcriber not started. Call start() first.")
 
-        try:
-            from telethon.errors import (  # type: ignore[import-untyped]
-                FloodWaitError,
-                MessageIdInvalidError,
-                PremiumAccountRequiredError,
+        cache_key = (str(peer), msg_id)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug(f"Transcription cache hit for msg_id={msg_id}")
+            return cached
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_transcription(cache_key, peer, msg_id, timeout, poll_interval)
             )
-            from telethon.tl import functions  # type: ignore[import-untyped]
-        except ImportError as e:
-            raise ImportError("telethon is required for voice transcription.") from e
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        else:
+            logger.debug(f"Joining in-flight transcription for msg_id={msg_id}")
+
+        # Shielded so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: tuple[str, int], task: asyncio.Task[Any]) -> None:
+        """Remove a finished request from the in-flight map.
+
+        Args:
+            key: (peer, msg_id) cache key.
+            task: The finished request task.
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _fetch_transcription(
+        self,
+        cache_key: tuple[str, int],
+        peer: int | str,
+        msg_id: int,
+        timeout: float,
+        poll_interval: float,
+    ) -> TranscriptionResult:
+        """Transcribe a voice message that is not in the in-memory cache.
+
+        Args:
+            cache_key: (peer, msg_id) cache key.
+            peer: Chat/user ID or username where the voice message is.
+            msg_id: Message ID of the voice message.
+            timeout: Maximum time to wait for transcription (seconds).
+            poll_interval: Initial interval between polls for pending results.
+
+        Returns:
+            TranscriptionResult with transcribed text.
+
+        Raises:
+            TranscriptionError: If client is not initialized or the request fails.
+            PremiumRequiredError: If Premium subscription is required.
+            TranscriptionPendingError: If transcription times out.
+        """
+        if self._client is None:
+            raise TranscriptionError("Client not initialized")
+
+        if self._cache_db_path is not None:
+            cached = await asyncio.to_thread(self._load_persisted_sync, cache_key)
+            if cached is not None:
+                logger.debug(f"Persistent transcription cache hit for msg_id={msg_id}")
+                self._store_cached(cache_key, cached)
+                return cached
+
+        telethon = _get_telethon()
 
         try:
-            result = await self._client(
-                functions.messages.TranscribeAudioRequest(peer=peer, msg_id=msg_id)
-            )
+            result = await self._client(telethon.TranscribeAudioRequest(peer=peer, msg_id=msg_id))
 
             # Handle pending transcription with polling
             if result.pending:
@@ -276,75 +632,111 @@ class VoiceTranscriber:
                 )
                 raise TranscriptionError(f"Telegram transcription error: {result.text}")
 
-            return TranscriptionResult(
+            transcription = TranscriptionResult(
                 text=result.text,
                 transcription_id=result.transcription_id,
                 pending=result.pending,
                 trial_remains=getattr(result, "trial_remains_num", None),
             )
+            if not transcription.pending:
+                self._store_cached(cache_key, transcription)
+                if self._cache_db_path is not None:
+                    await asyncio.to_thread(self._persist_sync, cache_key, transcription)
+            return transcription
 
-        except PremiumAccountRequiredError as e:
+        except telethon.PremiumAccountRequiredError as e:
             logger.error("Telegram Premium required for transcription")
             raise PremiumRequiredError(
                 "Telegram Premium subscription required for voice transcription"
             ) from e
-        except FloodWaitError as e:
+        except telethon.FloodWaitError as e:
             logger.warning(f"FloodWait: need to wait {e.seconds} seconds")
             raise TranscriptionError(f"Rate limited. Please wait {e.seconds} seconds.") from e
-        except MessageIdInvalidError as e:
+        except telethon.MessageIdInvalidError as e:
             logger.error(f"Invalid message ID: {msg_id}")
             raise TranscriptionError(f"Invalid message ID: {msg_id}") from e
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise TranscriptionError(f"Transcription failed: {e}") from e
 
+    async def transcribe_many(
+        self,
+        items: list[tuple[int | str, int]],
+        concurrency: int = 8,
+        timeout: float = 30.0,
+    ) -> list[TranscriptionResult | BaseException]:
+        """Transcribe several voice messages concurrently.
+
+        Args:
+            items: (peer, msg_id) pairs to transcribe.
+            concurrency: Maximum number of requests in flight at once.
+            timeout: Maximum time to wait for each transcription (seconds).
+
+        Returns:
+            One entry per item, in input order: the TranscriptionResult, or the
+            exception raised for that item.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _transcribe_one(peer: int | str, msg_id: int) -> TranscriptionResult:
+            async with semaphore:
+                return await self.transcribe_voice(peer, msg_id, timeout=timeout)
+
+        return await asyncio.gather(
+            *(_transcribe_one(peer, msg_id) for peer, msg_id in items),
+            return_exceptions=True,
+        )
+
     async def transcribe_voice_file(
         self,
         voice_data: bytes,
         duration: int = 0,
         timeout: float = 30.0,
-        poll_interval: float = 1.0,
+        poll_interval: float = 0.3,
     ) -> TranscriptionResult:
         """Transcribe a voice file by uploading to Saved Messages.
 
         This method uploads the voice file to the Telethon user's Saved Messages,
-        transcribes it, and then deletes the message.
+        transcribes it, and then deletes the message in the background.
 
         Args:
             voice_data: Raw voice file bytes (OGG format).
             duration: Duration of the voice message in seconds.
             timeout: Maximum time to wait for transcription (seconds).
-            poll_interval: Interval between polling for pending results.
+            poll_interval: Initial interval between polls for pending results.
 
         Returns:
             TranscriptionResult with transcribed text.
 
         Raises:
-            TranscriptionError: If transcriber is not started or upload fails.
+            TranscriptionError: If transcriber is not started, voice data is
+                shorter than MIN_VOICE_DATA_BYTES, or upload fails.
             PremiumRequiredError: If Premium subscription is required.
             TranscriptionPendingError: If transcription times out.
         """
         if not self._client or not self._started:
             raise TranscriptionError("Transcriber not started. Call start() first.")
 
-        try:
-            from telethon.errors import (
-                FloodWaitError,
-                PremiumAccountRequiredError,
-            )
-            from telethon.tl import functions, types
-        except ImportError as e:
-            raise ImportError("telethon is required for voice transcription.") from e
+        # Skip the upload and transcribe round trips for data Telegram would reject
+        if len(voice_data) < MIN_VOICE_DATA_BYTES:
+            raise TranscriptionError(f"Voice data too short or empty ({len(voice_data)} bytes)")
+
+        telethon = _get_telethon()
 
         sent_message = None
         try:
             # Create proper voice attributes for Telegram to recognize it as voice
-            voice_attrs = [
-                types.DocumentAttributeAudio(
-                    duration=duration,
-                    voice=True,  # Critical: marks as voice message
-                )
-            ]
+            if duration == 0 and self._default_voice_attrs is not None:
+                voice_attrs = self._default_voice_attrs
+            else:
+                voice_attrs = [
+                    telethon.DocumentAttributeAudio(
+                        duration=duration,
+                        voice=True,  # Critical: marks as voice message
+                    )
+                ]
+                if duration == 0:
+                    self._default_voice_attrs = voice_attrs
 
             # Upload voice file to Saved Messages ("me")
             logger.info(
@@ -361,7 +753,7 @@ class VoiceTranscriber:
 
             # Transcribe from Saved Messages
             result = await self._client(
-                functions.messages.TranscribeAudioRequest(
+                telethon.TranscribeAudioRequest(
                     peer="me",
                     msg_id=sent_message.id,
                 )
@@ -389,25 +781,39 @@ class VoiceTranscriber:
                 trial_remains=getattr(result, "trial_remains_num", None),
             )
 
-        except PremiumAccountRequiredError as e:
+        except telethon.PremiumAccountRequiredError as e:
             logger.error("Telegram Premium required for transcription")
             raise PremiumRequiredError(
                 "Telegram Premium subscription required for voice transcription"
             ) from e
-        except FloodWaitError as e:
+        except telethon.FloodWaitError as e:
             logger.warning(f"FloodWait: need to wait {e.seconds} seconds")
             raise TranscriptionError(f"Rate limited. Please wait {e.seconds} seconds.") from e
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise TranscriptionError(f"Transcription failed: {e}") from e
         finally:
-            # Clean up: delete the uploaded message from Saved Messages
+            # Clean up: delete the uploaded message from Saved Messages without
+            # making the caller wait for another round trip
             if sent_message is not None:
-                try:
-                    await self._client.delete_messages("me", [sent_message.id])
-                    logger.debug(f"Deleted temp voice message {sent_message.id}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp message: {e}")
+                task = asyncio.create_task(self._safe_delete("me", sent_message.id))
+                self._pending_cleanup.add(task)
+                task.add_done_callback(self._pending_cleanup.discard)
+
+    async def _safe_delete(self, peer: int | str, msg_id: int) -> None:
+        """Delete a temporary message, logging instead of raising on failure.
+
+        Args:
+            peer: Chat/user ID where the message is.
+            msg_id: ID of the message to delete.
+        """
+        if self._client is None:
+            return
+        try:
+            await self._client.delete_messages(peer, [msg_id])
+            logger.debug(f"Deleted temp voice message {msg_id}")
+        except Exception as e:
+            logger.warning(f"Failed to delete temp message: {e}")
 
     async def _poll_transcription(
         self,
@@ -424,7 +830,7 @@ class VoiceTranscriber:
             msg_id: Message ID of the voice message.
             transcription_id: Transcription ID from initial request.
             timeout: Maximum polling time.
-            poll_interval: Time between polls.
+            poll_interval: Initial time between polls; grows with each attempt.
 
         Returns:
             Raw Telethon TranscribedAudio result.
@@ -433,36 +839,57 @@ class VoiceTranscriber:
             TranscriptionPendingError: If transcription doesn't complete in time.
             TranscriptionError: If client is not initialized.
         """
-        from telethon.tl import functions
-
         if self._client is None:
             raise TranscriptionError("Client not initialized")
 
-        start_time = asyncio.get_running_loop().time()
+        transcribe_request = _get_telethon().TranscribeAudioRequest
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        attempt = 0
 
         while True:
-            elapsed = asyncio.get_running_loop().time() - start_time
+            elapsed = loop.time() - start_time
             if elapsed >= timeout:
                 raise TranscriptionPendingError(
                     f"Transcription still pending after {timeout}s timeout"
                 )
 
-            await asyncio.sleep(poll_interval)
+            delay = min(poll_interval * POLL_BACKOFF_FACTOR**attempt, POLL_MAX_INTERVAL)
+            delay += random.uniform(0, POLL_JITTER * poll_interval)
+            # Never sleep past the deadline
+            await asyncio.sleep(min(delay, timeout - elapsed))
+            attempt += 1
 
-            result = await self._client(
-                functions.messages.TranscribeAudioRequest(peer=peer, msg_id=msg_id)
-            )
+            result = await self._client(transcribe_request(peer=peer, msg_id=msg_id))
 
             if not result.pending:
                 return result
 
-            logger.debug(
-                f"Still pending... elapsed={elapsed:.1f}s, " f"transcription_id={transcription_id}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Still pending... elapsed=%.1fs, transcription_id=%d",
+                    elapsed,
+                    transcription_id,
+                )
+
+
+@functools.cache
+def _build_transcriber(
+    api_id: int, api_hash: str, phone: str, session_name: str
+) -> VoiceTranscriber:
+    """Create the VoiceTranscriber for one set of credentials, once.
 
+    Args:
+        api_id: Telegram API ID.
+        api_hash: Telegram API hash.
+        phone: Phone number.
+        session_name: Session file name.
 
-# Global transcriber instance (lazy loaded)
-_transcriber: VoiceTranscriber | None = None
+    Returns:
+        The VoiceTranscriber shared by all callers with these arguments.
+    """
+    return VoiceTranscriber(api_id, api_hash, phone, session_name)
 
 
 def get_transcriber(
@@ -471,24 +898,18 @@ def get_transcriber(
     phone: str | None = None,
     session_name: str = "jarvis_premium",
 ) -> VoiceTranscriber | None:
-    """Get or create the global VoiceTranscriber instance.
+    """Get or create the shared VoiceTranscriber for the given credentials.
 
     Args:
-        api_id: Telegram API ID (required for first call).
-        api_hash: Telegram API hash (required for first call).
-        phone: Phone number (required for first call).
+        api_id: Telegram API ID.
+        api_hash: Telegram API hash.
+        phone: Phone number.
         session_name: Session file name.
 
     Returns:
-        VoiceTranscriber instance or None if credentials not provided.
+        VoiceTranscriber instance (the same one for repeated calls with the same
+        arguments) or None if credentials not provided.
     """
-    global _transcriber
-
-    if _transcriber is not None:
-        return _transcriber
-
     if api_id is None or api_hash is None or phone is None:
         return None
-
-    _transcriber = VoiceTranscriber(api_id, api_hash, phone, session_name)
-    return _transcriber
+    return _build_transcriber(api_id, api_hash, phone, session_name)
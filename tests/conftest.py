@@ -4,11 +4,15 @@ This module provides mock infrastructure for testing, especially for telethon.
 """
 
 import sys
-from typing import Any, Dict
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+if TYPE_CHECKING:
+    from jarvis_mk1_lite.transcription import VoiceTranscriber
 
 # ==============================================================================
 # P2-TRANS-001: Mock Telethon Infrastructure
@@ -62,6 +66,14 @@ class MockDocumentAttributeAudio:
 class MockTelegramClient:
     """Mock TelegramClient for testing."""
 
+    # Shared happy-path result; cheaper than building a MagicMock per request
+    _DEFAULT_RESULT = SimpleNamespace(
+        text="Mock transcription result",
+        transcription_id=99999,
+        pending=False,
+        trial_remains_num=None,
+    )
+
     def __init__(
         self,
         session: str,
@@ -109,14 +121,9 @@ class MockTelegramClient:
         """Mock delete_messages method."""
         pass
 
-    async def __call__(self, request: Any) -> MagicMock:
+    async def __call__(self, request: Any) -> SimpleNamespace:
         """Mock call method for API requests."""
-        result = MagicMock()
-        result.text = "Mock transcription result"
-        result.transcription_id = 99999
-        result.pending = False
-        result.trial_remains_num = None
-        return result
+        return self._DEFAULT_RESULT
 
 
 def create_mock_telethon_modules() -> Dict[str, MagicMock]:
@@ -164,10 +171,12 @@ def create_mock_telethon_modules() -> Dict[str, MagicMock]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_telethon_modules() -> Dict[str, MagicMock]:
     """Fixture providing mock telethon modules.
 
+    Session-scoped: tests only read these modules, so one set is shared.
+
     Returns:
         Dict with mock modules for use with patch.dict(sys.modules, ...).
     """
@@ -188,6 +197,35 @@ def mock_telegram_client() -> MockTelegramClient:
     )
 
 
+@pytest.fixture
+def make_started_transcriber(
+    mock_transcription_result: MagicMock,
+) -> Callable[..., "VoiceTranscriber"]:
+    """Fixture providing a factory for started VoiceTranscribers.
+
+    By default the client is an AsyncMock: requests return
+    ``mock_transcription_result`` and uploads get message id 12345. Pass
+    ``client`` to replace it; other keyword arguments go to VoiceTranscriber.
+
+    Returns:
+        Factory creating a started VoiceTranscriber with a mock client.
+    """
+    from jarvis_mk1_lite.transcription import VoiceTranscriber
+
+    def factory(client: AsyncMock | None = None, **kwargs: Any) -> VoiceTranscriber:
+        transcriber = VoiceTranscriber(
+            api_id=12345, api_hash="test_hash", phone="+79001234567", **kwargs
+        )
+        transcriber._started = True
+        if client is None:
+            client = AsyncMock(return_value=mock_transcription_result)
+            client.send_file = AsyncMock(return_value=MagicMock(id=12345))
+        transcriber._client = client
+        return transcriber
+
+    return factory
+
+
 @pytest.fixture
 def mock_transcription_result() -> MagicMock:
     """Fixture providing a mock transcription result.
@@ -223,17 +261,20 @@ def mock_pending_transcription_result() -> MagicMock:
 # ==============================================================================
 
 
-@pytest.fixture
+_SAMPLE_VOICE = b"\x00\x01\x02\x03" * 100  # 400 bytes of sample data
+
+
+@pytest.fixture(scope="session")
 def sample_voice_bytes() -> bytes:
     """Fixture providing sample voice message bytes.
 
     Returns:
         Sample bytes representing voice data.
     """
-    return b"\x00\x01\x02\x03" * 100  # 400 bytes of sample data
+    return _SAMPLE_VOICE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text_content() -> str:
     """Fixture providing sample text content.
 
@@ -34,6 +34,9 @@ class LiveE2EConfig:
     # Test behavior
     cleanup_after_test: bool = True  # Delete test messages after test
 
+    # Exported Telethon StringSession; used instead of session_path when set
+    string_session: str | None = None
+
     @classmethod
     def from_env(cls) -> "LiveE2EConfig":
         """Load configuration from environment variables.
@@ -48,9 +51,18 @@ class LiveE2EConfig:
         - LIVE_E2E_BOT: Bot username (default: @jarvis_mk1_bot)
         - LIVE_E2E_TIMEOUT: Response timeout in seconds (default: 30)
         - LIVE_E2E_DELAY: Delay between tests in seconds (default: 2.0)
+        - LIVE_E2E_PHONES: Comma-separated account pool for pytest-xdist workers
+        - LIVE_E2E_STRING_SESSION: Exported StringSession (e.g. for CI, no session file)
+        - LIVE_E2E_STRING_SESSIONS: Comma-separated StringSessions, in LIVE_E2E_PHONES order
+
+        Under pytest-xdist (``PYTEST_XDIST_WORKER`` set) every worker gets its
+        own session file. With more than one worker, each worker also needs its
+        own account: worker ``gwN`` takes the N-th entry of LIVE_E2E_PHONES and,
+        if string sessions are used, of LIVE_E2E_STRING_SESSIONS.
 
         Raises:
-            ValueError: If required environment variables are missing.
+            ValueError: If required environment variables are missing, or
+                there are fewer accounts or sessions than xdist workers.
         """
         api_id_str = os.getenv("LIVE_E2E_API_ID")
         api_hash = os.getenv("LIVE_E2E_API_HASH")
@@ -69,6 +81,35 @@ class LiveE2EConfig:
             raise ValueError(f"LIVE_E2E_API_ID must be an integer: {e}") from e
 
         session_name = os.getenv("LIVE_E2E_SESSION", "live_e2e_session")
+        string_session = os.getenv("LIVE_E2E_STRING_SESSION") or None
+        worker_id = os.getenv("PYTEST_XDIST_WORKER")
+        if worker_id:
+            # Telethon sessions are SQLite files and cannot be shared between processes
+            session_name = f"{session_name}_{worker_id}"
+            worker_index = int(worker_id.removeprefix("gw"))
+            worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+            phone_pool = _split_env_list("LIVE_E2E_PHONES")
+            if phone_pool or worker_count > 1:
+                # Workers sharing an account would share its bot session and model
+                if len(phone_pool) < worker_count:
+                    raise ValueError(
+                        f"LIVE_E2E_PHONES lists {len(phone_pool)} accounts for "
+                        f"{worker_count} xdist workers; each worker needs its own"
+                    )
+                phone = phone_pool[worker_index]
+            session_pool = _split_env_list("LIVE_E2E_STRING_SESSIONS")
+            if session_pool:
+                if len(session_pool) < worker_count:
+                    raise ValueError(
+                        f"LIVE_E2E_STRING_SESSIONS lists {len(session_pool)} sessions for "
+                        f"{worker_count} xdist workers; each worker needs its own"
+                    )
+                string_session = session_pool[worker_index]
+            elif string_session and worker_count > 1:
+                raise ValueError(
+                    "LIVE_E2E_STRING_SESSION cannot be shared by xdist workers; "
+                    "set LIVE_E2E_STRING_SESSIONS with one session per worker"
+                )
         session_path = Path(__file__).parent / session_name
 
         bot_username = os.getenv("LIVE_E2E_BOT", "@jarvis_mk1_bot")
@@ -86,6 +127,7 @@ class LiveE2EConfig:
             bot_username=bot_username,
             response_timeout=int(timeout_str),
             between_tests_delay=float(delay_str),
+            string_session=string_session,
         )
 
     def validate(self) -> None:
@@ -104,6 +146,19 @@ class LiveE2EConfig:
             raise ValueError("bot_username must start with @")
 
 
+def _split_env_list(name: str) -> list[str]:
+    """Read a comma-separated environment variable.
+
+    Args:
+        name: Environment variable name.
+
+    Returns:
+        Non-empty stripped entries, in order.
+    """
+    entries = (entry.strip() for entry in os.getenv(name, "").split(","))
+    return [entry for entry in entries if entry]
+
+
 def is_live_e2e_configured() -> bool:
     """Check if Live E2E environment is configured.
 
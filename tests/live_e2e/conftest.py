@@ -2,18 +2,35 @@
 
 P0-LIVE-001, P0-LIVE-004: Telethon client fixture and session management.
 
-Uses pytest-asyncio 0.21+ loop_scope for proper event loop handling with Telethon.
+All tests and fixtures share one session event loop with the Telethon client.
+Live tests get it from pytest_collection_modifyitems and session fixtures from
+their own scope, so this holds from the repo root too, where this directory's
+pytest.ini is not read. Function-scoped async fixtures set it explicitly.
+
+Independent tests can be sharded with pytest-xdist::
+
+    pytest -n 4 --dist loadgroup tests/live_e2e
+
+Tests marked ``serial`` are pinned to a single worker.
 """
 
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING, AsyncGenerator
 
 import pytest
 import pytest_asyncio
 
 from .config import LiveE2EConfig, get_config, is_live_e2e_configured
+from .helpers import (
+    bot_replies,
+    cleanup_messages,
+    input_peer,
+    register_input_peer,
+    seconds_since_last_bot_message,
+)
 
 if TYPE_CHECKING:
     from telethon import TelegramClient
@@ -26,20 +43,38 @@ def pytest_configure(config: pytest.Config) -> None:
         "markers",
         "live: mark test as Live E2E test (requires real Telegram)",
     )
+    config.addinivalue_line(
+        "markers",
+        "serial: mark Live E2E test as touching bot-wide state (one xdist worker)",
+    )
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
-    """Skip live tests if environment is not configured.
+    """Deselect live tests if environment is not configured.
 
-    Also adds loop_scope="session" to all asyncio tests in this directory.
+    Async live tests are run in the session event loop. Tests marked
+    ``serial`` share one xdist group, so ``--dist loadgroup`` runs them on
+    the same worker.
     """
     if not is_live_e2e_configured():
-        skip_live = pytest.mark.skip(
-            reason="Live E2E not configured. Set LIVE_E2E_* environment variables."
-        )
+        # Drop live tests en bloc rather than attaching a skip marker to each
+        deselected: list[pytest.Item] = []
+        kept: list[pytest.Item] = []
         for item in items:
-            if "live" in item.keywords:
-                item.add_marker(skip_live)
+            (deselected if "live" in item.keywords else kept).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = kept
+        return
+
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    serial_group = pytest.mark.xdist_group("serial")
+    for item in items:
+        if "live" in item.keywords and pytest_asyncio.is_async_test(item):
+            # Prepend so it is the closest asyncio marker, ahead of auto mode's
+            item.add_marker(session_loop, append=False)
+        if "serial" in item.keywords:
+            item.add_marker(serial_group)
 
 
 @pytest.fixture(scope="session")
@@ -57,14 +92,16 @@ def live_config() -> LiveE2EConfig:
     return get_config()
 
 
-@pytest_asyncio.fixture(scope="session", loop_scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def telethon_client(
     live_config: LiveE2EConfig,
 ) -> AsyncGenerator["TelegramClient", None]:
     """Create and manage Telethon client for Live E2E tests.
 
     This fixture creates a real Telegram client using Telethon.
-    The session is persisted between test runs to avoid re-authentication.
+    The session is persisted between test runs to avoid re-authentication,
+    either in the session file or, when LIVE_E2E_STRING_SESSION is set,
+    as an exported StringSession (useful where no session file exists, e.g. CI).
 
     P0-LIVE-001: Telethon Client Fixture
 
@@ -76,11 +113,16 @@ async def telethon_client(
     """
     try:
         from telethon import TelegramClient
+        from telethon.sessions import StringSession
     except ImportError:
         pytest.skip("Telethon not installed. Run: pip install telethon")
 
+    session: str | StringSession = str(live_config.session_path)
+    if live_config.string_session:
+        session = StringSession(live_config.string_session)
+
     client = TelegramClient(
-        str(live_config.session_path),
+        session,
         live_config.api_id,
         live_config.api_hash,
     )
@@ -98,7 +140,7 @@ async def telethon_client(
     await client.disconnect()
 
 
-@pytest_asyncio.fixture(scope="session", loop_scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def bot_entity(
     telethon_client: "TelegramClient",
     live_config: LiveE2EConfig,
@@ -111,21 +153,56 @@ async def bot_entity(
         telethon_client: Connected Telethon client.
         live_config: Live E2E configuration.
 
+    The bot's InputPeer is resolved here once and registered for the
+    helpers, so sends skip peer resolution for the rest of the session.
+
     Returns:
         Bot entity (User object).
     """
     bot = await telethon_client.get_entity(live_config.bot_username)
+    register_input_peer(bot, await telethon_client.get_input_entity(bot))
     return bot
 
 
+@pytest_asyncio.fixture(scope="session")
+async def cleanup_queue(
+    telethon_client: "TelegramClient",
+    bot_entity: "User",
+    live_config: LiveE2EConfig,
+) -> AsyncGenerator[list[int], None]:
+    """Collect test message IDs and delete them all at session end.
+
+    Tests append the IDs of messages to remove; a single cleanup_messages
+    call at teardown replaces one delete RPC per test.
+
+    Args:
+        telethon_client: Connected Telethon client.
+        bot_entity: Bot entity (chat to delete from).
+        live_config: Live E2E configuration.
+
+    Yields:
+        Shared list of message IDs to delete.
+    """
+    queue: list[int] = []
+    yield queue
+
+    if live_config.cleanup_after_test:
+        await cleanup_messages(telethon_client, bot_entity, queue)
+
+
 @pytest_asyncio.fixture(loop_scope="session")
 async def between_tests_delay(live_config: LiveE2EConfig) -> None:
     """Add delay between tests to avoid Telegram rate limiting.
 
+    Only the part of the delay not already spent since the bot's last
+    message is slept.
+
     Args:
         live_config: Live E2E configuration.
     """
-    await asyncio.sleep(live_config.between_tests_delay)
+    remaining = live_config.between_tests_delay - seconds_since_last_bot_message()
+    if remaining > 0:
+        await asyncio.sleep(remaining)
 
 
 @pytest_asyncio.fixture(loop_scope="session")
@@ -144,20 +221,47 @@ async def reset_session(
         bot_entity: Bot entity.
         live_config: Live E2E configuration.
     """
-    # Send /new command
-    sent_message = await telethon_client.send_message(bot_entity, "/new")
-    sent_id = sent_message.id
-
-    # Wait for the bot to respond to /new (confirm session reset)
-    deadline = asyncio.get_running_loop().time() + 30
-    while asyncio.get_running_loop().time() < deadline:
-        messages = await telethon_client.get_messages(bot_entity, limit=5)
-        for msg in messages:
-            if msg.id > sent_id and msg.sender_id == bot_entity.id:
-                # Got response, session is reset
-                await asyncio.sleep(1)  # Small delay before test continues
-                return
-        await asyncio.sleep(0.5)
+    async with bot_replies(telethon_client, bot_entity) as replies:
+        # Send /new command
+        sent_message = await telethon_client.send_message(input_peer(bot_entity), "/new")
+        replies.after_id = sent_message.id
+
+        # Wait for the bot to respond to /new (confirm session reset)
+        try:
+            await replies.get(30)
+            return
+        except TimeoutError:
+            pass
 
     # If no response within 30 seconds, continue anyway (but log warning)
     await asyncio.sleep(2)
+
+
+@pytest.fixture(scope="session")
+def sample_txt_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the .txt file used by upload tests, once per session.
+
+    Args:
+        tmp_path_factory: Pytest session temp directory factory.
+
+    Returns:
+        Path to the sample text file.
+    """
+    path = tmp_path_factory.mktemp("upload") / "sample.txt"
+    path.write_text("This is a test file content.\nLine 2 of the test.")
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_py_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the .py file used by upload tests, once per session.
+
+    Args:
+        tmp_path_factory: Pytest session temp directory factory.
+
+    Returns:
+        Path to the sample Python file.
+    """
+    path = tmp_path_factory.mktemp("upload") / "sample.py"
+    path.write_text('def hello():\n    print("Hello, World!")\n\nhello()')
+    return path
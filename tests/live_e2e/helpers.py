@@ -6,11 +6,17 @@ Utilities for sending messages, waiting for responses, and cleanup.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import functools
+import re
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from telethon import TelegramClient
-    from telethon.tl.types import Message, User
+    from telethon.events import NewMessage
+    from telethon.tl.types import InputPeerUser, Message, User
 
 
 class LiveE2EError(Exception):
@@ -25,6 +31,222 @@ class UnexpectedResponseError(LiveE2EError):
     """Raised when bot response doesn't match expectations."""
 
 
+# Marker the bot's chunker puts on each part of a split response
+_PART_RE = re.compile(r"\[Part (\d+)/(\d+)\]")
+
+# InputPeer per bot id, resolved once per session by the bot_entity fixture
+_input_peers: dict[int, "InputPeerUser"] = {}
+
+
+def register_input_peer(bot: "User", peer: "InputPeerUser") -> None:
+    """Remember the resolved InputPeer to use when talking to a bot.
+
+    Args:
+        bot: Bot entity.
+        peer: InputPeer from client.get_input_entity(bot).
+    """
+    _input_peers[bot.id] = peer
+
+
+def input_peer(bot: "User") -> "User | InputPeerUser":
+    """Get the registered InputPeer for a bot, or the entity itself.
+
+    Args:
+        bot: Bot entity.
+
+    Returns:
+        Registered InputPeer, so Telethon skips peer resolution, else bot.
+    """
+    return _input_peers.get(bot.id, bot)
+
+
+# time.monotonic() of the last bot message seen by any BotReplies handler
+_last_bot_message_time: float | None = None
+
+
+def seconds_since_last_bot_message() -> float:
+    """Get seconds elapsed since the bot last sent a message.
+
+    Returns:
+        Elapsed seconds, or infinity if no bot message has been seen yet.
+    """
+    if _last_bot_message_time is None:
+        return float("inf")
+    return time.monotonic() - _last_bot_message_time
+
+
+class BotReplies:
+    """Bot messages pushed by NewMessage (and optionally MessageEdited) handlers.
+
+    Messages are returned in arrival order; an edited message is queued again.
+
+    Attributes:
+        after_id: Only messages with a greater id are returned; set it to the
+            id of the message just sent.
+    """
+
+    def __init__(self, after_id: int = 0) -> None:
+        self.after_id = after_id
+        self._queue: asyncio.Queue["Message"] = asyncio.Queue()
+
+    async def _on_message(self, event: "NewMessage.Event") -> None:
+        """Event handler: queue an incoming bot message."""
+        global _last_bot_message_time
+        _last_bot_message_time = time.monotonic()
+        self._queue.put_nowait(event.message)
+
+    async def get(self, timeout: float) -> "Message":
+        """Wait for the next bot message newer than after_id.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            Next bot message.
+
+        Raises:
+            TimeoutError: If no such message arrives within timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            # Take queued messages first: wait_for() times out at once when no
+            # time is left, even if a message is already waiting
+            try:
+                msg = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"No bot message within {timeout}s") from None
+                msg = await asyncio.wait_for(self._queue.get(), remaining)
+            if msg.id > self.after_id:
+                return msg
+
+
+@asynccontextmanager
+async def bot_replies(
+    client: "TelegramClient",
+    bot: "User",
+    after_id: int = 0,
+    edits: bool = False,
+) -> AsyncIterator[BotReplies]:
+    """Collect the bot's new messages while the block runs.
+
+    Enter this before sending, so a fast reply cannot be missed.
+
+    Args:
+        client: Connected Telethon client.
+        bot: Bot entity whose messages to collect.
+        after_id: Initial BotReplies.after_id.
+        edits: Also collect messages the bot edits.
+
+    Yields:
+        BotReplies fed by the event handlers; removed on exit.
+    """
+    from telethon import events
+
+    replies = BotReplies(after_id)
+    event_filters = [events.NewMessage(from_users=bot.id, incoming=True)]
+    if edits:
+        event_filters.append(events.MessageEdited(from_users=bot.id, incoming=True))
+    for event_filter in event_filters:
+        client.add_event_handler(replies._on_message, event_filter)
+    try:
+        yield replies
+    finally:
+        for event_filter in event_filters:
+            client.remove_event_handler(replies._on_message, event_filter)
+
+
+async def wait_for_bot_reply(
+    client: "TelegramClient",
+    bot: "User",
+    after_id: int,
+    timeout: float = 30,
+) -> "Message":
+    """Wait for the bot's first message after a message that was already sent.
+
+    The reply handler is registered first and recent history checked once
+    after that, so a reply that arrived before the call is not missed.
+
+    Args:
+        client: Connected Telethon client.
+        bot: Bot entity.
+        after_id: ID of the message the bot is replying to.
+        timeout: Maximum seconds to wait for the reply.
+
+    Returns:
+        Bot's reply message.
+
+    Raises:
+        ResponseTimeoutError: If bot doesn't respond within timeout.
+    """
+    async with bot_replies(client, bot, after_id) as replies:
+        messages = await client.get_messages(input_peer(bot), min_id=after_id, limit=10)
+        earlier = [msg for msg in messages if msg.sender_id == bot.id]
+        if earlier:
+            return min(earlier, key=lambda msg: msg.id)
+
+        try:
+            return await replies.get(timeout)
+        except TimeoutError as e:
+            raise ResponseTimeoutError(
+                f"Bot didn't respond within {timeout} seconds to message {after_id}"
+            ) from e
+
+
+async def wait_for_document_or_text(
+    client: "TelegramClient",
+    bot: "User",
+    after_id: int,
+    timeout: float = 30,
+    document_grace: float = 5.0,
+) -> list["Message"]:
+    """Wait for the bot to send a document after a message that was already sent.
+
+    Returns as soon as a document arrives. Once the bot has answered with
+    text only, the wait for a document ends document_grace seconds after
+    the call, so text-only answers don't hold the test for the full timeout.
+
+    Args:
+        client: Connected Telethon client.
+        bot: Bot entity.
+        after_id: ID of the message the bot is replying to.
+        timeout: Maximum seconds to wait for any reply.
+        document_grace: Seconds to keep waiting for a document after text.
+
+    Returns:
+        Bot's messages sent after after_id, sorted by id.
+
+    Raises:
+        ResponseTimeoutError: If bot doesn't respond within timeout.
+    """
+    responses: dict[int, "Message"] = {}
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async with bot_replies(client, bot, after_id) as replies:
+        messages = await client.get_messages(input_peer(bot), min_id=after_id, limit=10)
+        responses.update((msg.id, msg) for msg in messages if msg.sender_id == bot.id)
+
+        while not any(msg.document for msg in responses.values()):
+            remaining = start + (document_grace if responses else timeout) - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                msg = await replies.get(remaining)
+            except TimeoutError:
+                break
+            responses[msg.id] = msg
+
+    if not responses:
+        raise ResponseTimeoutError(
+            f"Bot didn't respond within {timeout} seconds to message {after_id}"
+        )
+
+    return [responses[msg_id] for msg_id in sorted(responses)]
+
+
 async def send_message_and_wait(
     client: "TelegramClient",
     bot: "User",
@@ -45,27 +267,16 @@ async def send_message_and_wait(
     Raises:
         ResponseTimeoutError: If bot doesn't respond within timeout.
     """
-    # Send the message
-    sent_message = await client.send_message(bot, text)
-    sent_id = sent_message.id
-
-    # Wait for response (message with id > sent_id from bot)
-    loop = asyncio.get_running_loop()
-    deadline = loop.time() + timeout
+    async with bot_replies(client, bot) as replies:
+        sent_message = await client.send_message(input_peer(bot), text)
+        replies.after_id = sent_message.id
 
-    while loop.time() < deadline:
-        # Get recent messages from chat with bot
-        messages = await client.get_messages(bot, limit=10)
-
-        for msg in messages:
-            # Find bot's response (message after our sent message)
-            if msg.id > sent_id and msg.sender_id == bot.id:
-                return msg
-
-        # Wait before checking again
-        await asyncio.sleep(0.5)
-
-    raise ResponseTimeoutError(f"Bot didn't respond within {timeout} seconds to: {text[:50]}...")
+        try:
+            return await replies.get(timeout)
+        except TimeoutError as e:
+            raise ResponseTimeoutError(
+                f"Bot didn't respond within {timeout} seconds to: {text[:50]}..."
+            ) from e
 
 
 async def send_and_collect_responses(
@@ -74,15 +285,22 @@ async def send_and_collect_responses(
     text: str,
     timeout: int = 30,
     max_messages: int = 10,
+    stop_when: Callable[["Message"], bool] | None = None,
 ) -> list["Message"]:
     """Send message and collect all response messages (for chunked responses).
 
+    Collection ends as soon as the last "[Part N/N]" chunk arrives, or a
+    message satisfies stop_when. Responses without part markers end after
+    3 seconds without a new or edited message.
+
     Args:
         client: Connected Telethon client.
         bot: Bot entity to send message to.
         text: Message text to send.
         timeout: Maximum seconds to wait for all responses.
         max_messages: Maximum number of response messages to collect.
+        stop_when: Predicate on each new or edited message; collection stops
+            at the first message it accepts.
 
     Returns:
         List of bot's response messages.
@@ -90,32 +308,32 @@ async def send_and_collect_responses(
     Raises:
         ResponseTimeoutError: If no response received within timeout.
     """
-    sent_message = await client.send_message(bot, text)
-    sent_id = sent_message.id
-
-    responses: list["Message"] = []
-    response_ids: set[int] = set()
+    # Latest version of each response message; edits replace earlier versions
+    responses: dict[int, "Message"] = {}
     loop = asyncio.get_running_loop()
     deadline = loop.time() + timeout
-    last_response_time = loop.time()
-
-    while loop.time() < deadline:
-        messages = await client.get_messages(bot, limit=20)
-
-        for msg in messages:
-            if msg.id > sent_id and msg.sender_id == bot.id and msg.id not in response_ids:
-                responses.append(msg)
-                response_ids.add(msg.id)
-                last_response_time = loop.time()
 
-        # If we have responses and no new ones for 3 seconds, assume done
-        if responses and (loop.time() - last_response_time) > 3:
-            break
-
-        if len(responses) >= max_messages:
-            break
-
-        await asyncio.sleep(0.5)
+    async with bot_replies(client, bot, edits=True) as replies:
+        sent_message = await client.send_message(input_peer(bot), text)
+        replies.after_id = sent_message.id
+
+        while len(responses) < max_messages:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            # Fallback: once the bot has answered, 3 idle seconds means done
+            wait = min(remaining, 3) if responses else remaining
+            try:
+                msg = await replies.get(wait)
+            except TimeoutError:
+                break
+            responses[msg.id] = msg
+
+            if stop_when is not None and stop_when(msg):
+                break
+            part = _PART_RE.search(msg.text or "")
+            if part and part.group(1) == part.group(2):
+                break
 
     if not responses:
         raise ResponseTimeoutError(
@@ -123,8 +341,7 @@ async def send_and_collect_responses(
         )
 
     # Sort by message id to get correct order
-    responses.sort(key=lambda m: m.id)
-    return responses
+    return [responses[msg_id] for msg_id in sorted(responses)]
 
 
 async def wait_for_callback_response(
@@ -153,38 +370,27 @@ async def wait_for_callback_response(
     if not message_with_buttons.buttons:
         raise LiveE2EError("Message has no inline buttons")
 
-    button_found = False
-    for row in message_with_buttons.buttons:
-        for button in row:
-            if hasattr(button, "data") and button.data:
-                if button.data.decode() == callback_data:
-                    await button.click()
-                    button_found = True
-                    break
-        if button_found:
-            break
-
-    if not button_found:
+    buttons_by_data = {
+        button.data.decode(): button
+        for row in message_with_buttons.buttons
+        for button in row
+        if getattr(button, "data", None)
+    }
+    button = buttons_by_data.get(callback_data)
+    if button is None:
         raise LiveE2EError(f"Button with callback_data={callback_data} not found")
 
-    # Wait for response
-    loop = asyncio.get_running_loop()
-    deadline = loop.time() + timeout
+    # The bot answers by editing the original message or sending a new one;
+    # listen for both before clicking so neither can be missed
     original_id = message_with_buttons.id
+    async with bot_replies(client, bot, after_id=original_id - 1, edits=True) as replies:
+        await button.click()
 
-    while loop.time() < deadline:
-        messages = await client.get_messages(bot, limit=10)
-
-        for msg in messages:
-            # Look for edited original or new message
-            if msg.id == original_id and msg.edit_date:
-                return msg
-            if msg.id > original_id and msg.sender_id == bot.id:
-                return msg
-
-        await asyncio.sleep(0.5)
-
-    raise ResponseTimeoutError(f"No response to callback {callback_data}")
+        # Wait for response
+        try:
+            return await replies.get(timeout)
+        except TimeoutError as e:
+            raise ResponseTimeoutError(f"No response to callback {callback_data}") from e
 
 
 async def cleanup_messages(
@@ -194,13 +400,60 @@ async def cleanup_messages(
 ) -> None:
     """Delete test messages from chat.
 
+    Telethon splits the IDs into 100-message deleteMessages requests, so
+    batch IDs (see the cleanup_queue fixture) rather than calling per test.
+
     Args:
         client: Connected Telethon client.
         bot: Bot entity (chat to delete from).
         message_ids: List of message IDs to delete.
     """
     if message_ids:
-        await client.delete_messages(bot, message_ids)
+        await client.delete_messages(input_peer(bot), message_ids)
+
+
+@functools.lru_cache(maxsize=64)
+def _substring_automaton(substrings: frozenset[str]) -> Any | None:
+    """Build an Aho-Corasick automaton matching all given substrings.
+
+    Args:
+        substrings: Non-empty substrings to match.
+
+    Returns:
+        Automaton yielding each matched substring, or None if
+        pyahocorasick is not installed.
+    """
+    try:
+        import ahocorasick  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for substring in sorted(substrings):
+        automaton.add_word(substring, substring)
+    automaton.make_automaton()
+    return automaton
+
+
+def _found_substrings(text: str, substrings: tuple[str, ...]) -> set[str]:
+    """Return which of the substrings occur in text, in a single pass if possible.
+
+    Args:
+        text: Text to scan.
+        substrings: Substrings to look for.
+
+    Returns:
+        Set of substrings present in text.
+    """
+    needles = frozenset(s for s in substrings if s)
+    automaton = _substring_automaton(needles) if needles else None
+    if automaton is None:
+        found = {s for s in needles if s in text}
+    else:
+        found = {match for _, match in automaton.iter(text)}
+    if "" in substrings:
+        found.add("")
+    return found
 
 
 def assert_contains(text: str, *substrings: str) -> None:
@@ -213,8 +466,9 @@ def assert_contains(text: str, *substrings: str) -> None:
     Raises:
         AssertionError: If any substring is missing.
     """
+    found = _found_substrings(text, substrings)
     for substring in substrings:
-        assert substring in text, f"Expected '{substring}' in response:\n{text}"
+        assert substring in found, f"Expected '{substring}' in response:\n{text}"
 
 
 def assert_not_contains(text: str, *substrings: str) -> None:
@@ -227,5 +481,35 @@ def assert_not_contains(text: str, *substrings: str) -> None:
     Raises:
         AssertionError: If any substring is found.
     """
+    found = _found_substrings(text, substrings)
     for substring in substrings:
-        assert substring not in text, f"Unexpected '{substring}' in response:\n{text}"
+        assert substring not in found, f"Unexpected '{substring}' in response:\n{text}"
+
+
+@functools.lru_cache(maxsize=64)
+def _any_substring_re(substrings: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a case-insensitive alternation of the given substrings.
+
+    Args:
+        substrings: Substrings to match.
+
+    Returns:
+        Pattern matching any of the substrings.
+    """
+    return re.compile("|".join(re.escape(s) for s in substrings), re.IGNORECASE)
+
+
+def assert_any(text: str, *substrings: str, message: str | None = None) -> None:
+    """Assert that text contains at least one of the substrings, ignoring case.
+
+    Args:
+        text: Text to check.
+        *substrings: Candidate substrings.
+        message: Assertion message; defaults to listing the substrings.
+
+    Raises:
+        AssertionError: If none of the substrings is present.
+    """
+    assert _any_substring_re(substrings).search(text), (
+        message or f"Expected one of {substrings} in response:\n{text}"
+    )
@@ -8,27 +8,33 @@ These tests verify advanced bot features using REAL Telegram. NO MOCKS.
 from __future__ import annotations
 
 import asyncio
-import tempfile
-from pathlib import Path
+import re
 from typing import TYPE_CHECKING
 
 import pytest
 
 from .helpers import (
     assert_contains,
+    bot_replies,
+    input_peer,
     send_and_collect_responses,
     send_message_and_wait,
+    wait_for_bot_reply,
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from telethon import TelegramClient
     from telethon.tl.types import User
 
     from .config import LiveE2EConfig
 
+# Words confirming wide context mode ("accumul" covers accumulating)
+_WIDE_CONTEXT_RE = re.compile(r"wide|context|accumul|collect", re.IGNORECASE)
+
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_wide_context_activation_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -48,19 +54,14 @@ async def test_wide_context_activation_live(
     )
 
     assert response.text is not None
-    text_lower = response.text.lower()
 
     # Should indicate wide context mode is activated
-    assert (
-        "wide" in text_lower
-        or "context" in text_lower
-        or "accumul" in text_lower  # accumulating
-        or "collect" in text_lower
+    assert _WIDE_CONTEXT_RE.search(
+        response.text
     ), f"Expected wide context confirmation, got: {response.text}"
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_wide_context_cancel_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -93,11 +94,11 @@ async def test_wide_context_cancel_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_file_upload_txt_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
     between_tests_delay: None,
+    sample_txt_file: "Path",
 ) -> None:
     """P3-LIVE-017: Test .txt file upload and processing.
 
@@ -105,46 +106,24 @@ async def test_file_upload_txt_live(
     - Bot accepts .txt file upload
     - Bot extracts and processes file content
     """
-    # Create a temporary test file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("This is a test file content.\nLine 2 of the test.")
-        temp_path = Path(f.name)
-
-    try:
-        # Send file to bot
-        await telethon_client.send_file(
-            bot_entity,
-            temp_path,
-            caption="Please analyze this file",
-        )
-
-        # Wait for response
-        await asyncio.sleep(3)
-
-        # Get recent messages
-        messages = await telethon_client.get_messages(bot_entity, limit=5)
-
-        # Should have a response about the file
-        found_response = False
-        for msg in messages:
-            if msg.sender_id == bot_entity.id and msg.text:
-                # Bot should acknowledge the file or process it
-                found_response = True
-                break
-
-        assert found_response, "Bot should respond to file upload"
+    # Send file to bot
+    sent = await telethon_client.send_file(
+        input_peer(bot_entity),
+        sample_txt_file,
+        caption="Please analyze this file",
+    )
 
-    finally:
-        # Cleanup temp file
-        temp_path.unlink(missing_ok=True)
+    # Bot should acknowledge the file or process it
+    response = await wait_for_bot_reply(telethon_client, bot_entity, sent.id, timeout=30)
+    assert response.text, "Bot should respond to file upload"
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_file_upload_py_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
     between_tests_delay: None,
+    sample_py_file: "Path",
 ) -> None:
     """Test .py file upload and processing.
 
@@ -152,37 +131,17 @@ async def test_file_upload_py_live(
     - Bot accepts .py file upload
     - Bot can analyze Python code
     """
-    # Create a temporary Python file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write('def hello():\n    print("Hello, World!")\n\nhello()')
-        temp_path = Path(f.name)
-
-    try:
-        await telethon_client.send_file(
-            bot_entity,
-            temp_path,
-            caption="What does this code do?",
-        )
-
-        # Wait for processing
-        await asyncio.sleep(5)
-
-        messages = await telethon_client.get_messages(bot_entity, limit=5)
-
-        found_response = False
-        for msg in messages:
-            if msg.sender_id == bot_entity.id and msg.text:
-                found_response = True
-                break
-
-        assert found_response, "Bot should respond to .py file"
+    sent = await telethon_client.send_file(
+        input_peer(bot_entity),
+        sample_py_file,
+        caption="What does this code do?",
+    )
 
-    finally:
-        temp_path.unlink(missing_ok=True)
+    response = await wait_for_bot_reply(telethon_client, bot_entity, sent.id, timeout=30)
+    assert response.text, "Bot should respond to .py file"
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_long_response_chunking_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -218,7 +177,6 @@ async def test_long_response_chunking_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_session_persistence_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -265,7 +223,6 @@ async def test_session_persistence_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_error_recovery_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -304,7 +261,7 @@ async def test_error_recovery_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.serial
 async def test_concurrent_messages_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -324,24 +281,27 @@ async def test_concurrent_messages_live(
         "What is 3+3?",
     ]
 
-    for msg in messages_to_send:
-        await telethon_client.send_message(bot_entity, msg)
-        await asyncio.sleep(0.5)  # Small delay
-
-    # Wait for all responses
-    await asyncio.sleep(30)
-
-    # Check we got responses
-    messages = await telethon_client.get_messages(bot_entity, limit=20)
-
-    bot_responses = [m for m in messages if m.sender_id == bot_entity.id]
+    async with bot_replies(telethon_client, bot_entity) as replies:
+        sent = await asyncio.gather(
+            *(telethon_client.send_message(input_peer(bot_entity), msg) for msg in messages_to_send)
+        )
+        replies.after_id = min(m.id for m in sent)
+
+        # Wait for all responses, or whatever arrived within the timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 60
+        bot_responses = []
+        while len(bot_responses) < len(messages_to_send):
+            try:
+                bot_responses.append(await replies.get(max(deadline - loop.time(), 0)))
+            except TimeoutError:
+                break
 
     # Should have at least some responses
     assert len(bot_responses) >= 1, "Should receive at least one response"
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_unicode_message_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -8,12 +8,15 @@ and verify REAL responses. NO MOCKS.
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 import pytest
 
 from .helpers import (
     assert_contains,
+    bot_replies,
+    input_peer,
     send_and_collect_responses,
     send_message_and_wait,
 )
@@ -22,9 +25,11 @@ if TYPE_CHECKING:
     from telethon import TelegramClient
     from telethon.tl.types import User
 
+# Any of these words confirms /new started a fresh session
+_NEW_SESSION_RE = re.compile(r"new|fresh|clear|session", re.IGNORECASE)
+
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_start_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -54,7 +59,6 @@ async def test_start_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_help_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -84,7 +88,6 @@ async def test_help_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_status_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -110,7 +113,6 @@ async def test_status_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_new_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -131,17 +133,10 @@ async def test_new_command_live(
 
     assert response.text is not None
     # Should indicate new session/conversation
-    text_lower = response.text.lower()
-    assert (
-        "new" in text_lower
-        or "fresh" in text_lower
-        or "clear" in text_lower
-        or "session" in text_lower
-    )
+    assert _NEW_SESSION_RE.search(response.text)
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_metrics_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -169,7 +164,6 @@ async def test_metrics_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_simple_message_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -207,7 +201,6 @@ async def test_simple_message_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_command_sequence_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -216,24 +209,24 @@ async def test_command_sequence_live(
     """Test a sequence of commands like a real user would.
 
     Simulates: /start -> /help -> /status -> /new
-    """
-    import asyncio
 
-    # 1. Start
-    response = await send_message_and_wait(telethon_client, bot_entity, "/start", timeout=30)
-    assert "Welcome" in response.text or "JARVIS" in response.text
-    await asyncio.sleep(1)
+    The commands are sent back to back and the four replies are read from one
+    reply stream, so the sequence costs one round-trip window instead of four.
+    """
+    commands = ["/start", "/help", "/status", "/new"]
 
-    # 2. Help
-    response = await send_message_and_wait(telethon_client, bot_entity, "/help", timeout=30)
-    assert "/start" in response.text
-    await asyncio.sleep(1)
+    async with bot_replies(telethon_client, bot_entity) as replies:
+        sent_ids = [
+            (await telethon_client.send_message(input_peer(bot_entity), cmd)).id for cmd in commands
+        ]
+        replies.after_id = sent_ids[0]
 
-    # 3. Status
-    response = await send_message_and_wait(telethon_client, bot_entity, "/status", timeout=30)
-    assert response.text is not None
-    await asyncio.sleep(1)
+        responses = [await replies.get(30) for _ in commands]
 
-    # 4. New (reset session)
-    response = await send_message_and_wait(telethon_client, bot_entity, "/new", timeout=30)
-    assert response.text is not None
+    # Replies may be handled concurrently by the bot, so match them by content
+    texts = [response.text for response in responses]
+    assert all(text is not None for text in texts)
+    # 1. Start
+    assert any("Welcome" in text or "JARVIS" in text for text in texts)
+    # 2. Help
+    assert any("/start" in text for text in texts)
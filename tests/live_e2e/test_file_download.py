@@ -7,12 +7,16 @@ These tests verify file download functionality using REAL Telegram. NO MOCKS.
 
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING
 
 import pytest
 
-from .helpers import send_message_and_wait
+from .helpers import (
+    assert_any,
+    input_peer,
+    send_message_and_wait,
+    wait_for_document_or_text,
+)
 
 if TYPE_CHECKING:
     from telethon import TelegramClient
@@ -20,7 +24,6 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_single_file_download_request_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -43,17 +46,17 @@ async def test_single_file_download_request_live(
 
     assert response.text is not None
     # Bot should either send the file or acknowledge the request
-    text_lower = response.text.lower()
-    assert (
-        "readme" in text_lower
-        or "file" in text_lower
-        or "download" in text_lower
-        or "send" in text_lower
-    ), f"Expected file-related response, got: {response.text}"
+    assert_any(
+        response.text,
+        "readme",
+        "file",
+        "download",
+        "send",
+        message=f"Expected file-related response, got: {response.text}",
+    )
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_file_not_found_response_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -73,19 +76,19 @@ async def test_file_not_found_response_live(
     )
 
     assert response.text is not None
-    text_lower = response.text.lower()
     # Should indicate file not found or error
-    assert (
-        "not found" in text_lower
-        or "not exist" in text_lower
-        or "error" in text_lower
-        or "cannot" in text_lower
-        or "unable" in text_lower
-    ), f"Expected error response for non-existent file, got: {response.text}"
+    assert_any(
+        response.text,
+        "not found",
+        "not exist",
+        "error",
+        "cannot",
+        "unable",
+        message=f"Expected error response for non-existent file, got: {response.text}",
+    )
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_directory_download_request_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -105,19 +108,19 @@ async def test_directory_download_request_live(
     )
 
     assert response.text is not None
-    text_lower = response.text.lower()
     # Bot should acknowledge directory request
-    assert (
-        "test" in text_lower
-        or "file" in text_lower
-        or "directory" in text_lower
-        or "folder" in text_lower
-        or "send" in text_lower
-    ), f"Expected directory-related response, got: {response.text}"
+    assert_any(
+        response.text,
+        "test",
+        "file",
+        "directory",
+        "folder",
+        "send",
+        message=f"Expected directory-related response, got: {response.text}",
+    )
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_glob_pattern_download_request_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -137,19 +140,19 @@ async def test_glob_pattern_download_request_live(
     )
 
     assert response.text is not None
-    text_lower = response.text.lower()
     # Bot should acknowledge the pattern request
-    assert (
-        "python" in text_lower
-        or ".py" in text_lower
-        or "file" in text_lower
-        or "src" in text_lower
-        or "send" in text_lower
-    ), f"Expected pattern-related response, got: {response.text}"
+    assert_any(
+        response.text,
+        "python",
+        ".py",
+        "file",
+        "src",
+        "send",
+        message=f"Expected pattern-related response, got: {response.text}",
+    )
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_file_download_with_specific_path_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -170,18 +173,18 @@ async def test_file_download_with_specific_path_live(
 
     assert response.text is not None
     # Bot should acknowledge the request
-    text_lower = response.text.lower()
-    assert (
-        "readme" in text_lower
-        or "file" in text_lower
-        or "download" in text_lower
-        or "path" in text_lower
-        or "send" in text_lower
-    ), f"Expected path-related response, got: {response.text}"
+    assert_any(
+        response.text,
+        "readme",
+        "file",
+        "download",
+        "path",
+        "send",
+        message=f"Expected path-related response, got: {response.text}",
+    )
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_multiple_files_download_request_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -201,24 +204,23 @@ async def test_multiple_files_download_request_live(
     )
 
     assert response.text is not None
-    text_lower = response.text.lower()
     # Bot should acknowledge multiple files
-    assert (
-        "file" in text_lower
-        or "readme" in text_lower
-        or "changelog" in text_lower
-        or "send" in text_lower
-        or "both" in text_lower
-    ), f"Expected multi-file response, got: {response.text}"
+    assert_any(
+        response.text,
+        "file",
+        "readme",
+        "changelog",
+        "send",
+        "both",
+        message=f"Expected multi-file response, got: {response.text}",
+    )
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_file_download_receives_document_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
     between_tests_delay: None,
-    reset_session: None,
 ) -> None:
     """P3-LIVE-027: Test that file download actually sends a document.
 
@@ -227,32 +229,21 @@ async def test_file_download_receives_document_live(
     - Document is received within timeout
     """
     # Send download request
-    await telethon_client.send_message(
-        bot_entity,
+    sent = await telethon_client.send_message(
+        input_peer(bot_entity),
         "Download the pyproject.toml file please",
     )
 
     # Wait for response(s) - could be text + document
-    await asyncio.sleep(5)
-
-    # Get recent messages
-    messages = await telethon_client.get_messages(bot_entity, limit=10)
+    messages = await wait_for_document_or_text(telethon_client, bot_entity, sent.id, timeout=30)
 
-    # Check if any document was received
-    document_received = False
-    for msg in messages:
-        if msg.sender_id == bot_entity.id:
-            if msg.document:
-                document_received = True
-                break
+    # Check if any document was received (messages are all from the bot)
+    document_received = any(msg.document for msg in messages)
 
     # Note: This test may fail if bot doesn't have the file or Claude
     # doesn't use the correct marker format. This is expected behavior
     # during initial development.
     if not document_received:
         # At minimum, bot should have sent a text response
-        text_responses = [
-            msg for msg in messages
-            if msg.sender_id == bot_entity.id and msg.text
-        ]
+        text_responses = [msg for msg in messages if msg.text]
         assert len(text_responses) > 0, "Bot should respond to download request"
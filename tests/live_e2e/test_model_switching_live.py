@@ -16,12 +16,16 @@ Test flow:
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import pytest
 
 from .helpers import (
+    assert_any,
     assert_contains,
+    bot_replies,
+    input_peer,
     send_and_collect_responses,
     send_message_and_wait,
 )
@@ -30,9 +34,13 @@ if TYPE_CHECKING:
     from telethon import TelegramClient
     from telethon.tl.types import User
 
+logger = logging.getLogger(__name__)
+
+# /model changes the account's model for every later test, keep them on one worker
+pytestmark = pytest.mark.serial
+
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_model_switch_to_opus_and_execute_task_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -53,7 +61,7 @@ async def test_model_switch_to_opus_and_execute_task_live(
     - Bot can handle complex reasoning with Opus
     """
     # Step 1: Switch to Opus
-    print("\n[OPUS TEST] Step 1: Switching to Opus 4.5...")
+    logger.debug("[OPUS TEST] Step 1: Switching to Opus 4.5...")
     switch_response = await send_message_and_wait(
         telethon_client,
         bot_entity,
@@ -62,7 +70,7 @@ async def test_model_switch_to_opus_and_execute_task_live(
     )
 
     assert switch_response.text is not None
-    print(f"[OPUS TEST] Switch response: {switch_response.text[:200]}...")
+    logger.debug("[OPUS TEST] Switch response: %s...", switch_response.text[:200])
 
     # Verify switch confirmation
     assert_contains(
@@ -70,10 +78,10 @@ async def test_model_switch_to_opus_and_execute_task_live(
         "Model changed",
         "Opus",
     )
-    print("[OPUS TEST] ✓ Model switch confirmed")
+    logger.debug("[OPUS TEST] ✓ Model switch confirmed")
 
     # Step 2: Execute a complex task suitable for Opus
-    print("[OPUS TEST] Step 2: Executing complex reasoning task...")
+    logger.debug("[OPUS TEST] Step 2: Executing complex reasoning task...")
     task_message = "Explain quantum entanglement in simple terms, using an analogy."
 
     task_responses = await send_and_collect_responses(
@@ -85,22 +93,22 @@ async def test_model_switch_to_opus_and_execute_task_live(
     )
 
     assert len(task_responses) > 0, "No response received from Opus model"
-    print(f"[OPUS TEST] Received {len(task_responses)} response(s)")
+    logger.debug("[OPUS TEST] Received %s response(s)", len(task_responses))
 
     # Verify we got a substantive response (not an error)
     first_response = task_responses[0].text or ""
-    print(f"[OPUS TEST] First response preview: {first_response[:300]}...")
+    logger.debug("[OPUS TEST] First response preview: %s...", first_response[:300])
 
     # Should contain actual explanation content
     assert len(first_response) > 100, "Response too short - may indicate error"
     # Should not contain error messages
-    assert "error" not in first_response.lower() or "quantum" in first_response.lower()
+    response_lower = first_response.lower()
+    assert "error" not in response_lower or "quantum" in response_lower
 
-    print("[OPUS TEST] ✓ Opus model successfully processed complex task")
+    logger.debug("[OPUS TEST] ✓ Opus model successfully processed complex task")
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_model_switch_to_sonnet_and_execute_task_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -121,7 +129,7 @@ async def test_model_switch_to_sonnet_and_execute_task_live(
     - Bot can handle balanced tasks with Sonnet
     """
     # Step 1: Switch to Sonnet
-    print("\n[SONNET TEST] Step 1: Switching to Sonnet 4.5...")
+    logger.debug("[SONNET TEST] Step 1: Switching to Sonnet 4.5...")
     switch_response = await send_message_and_wait(
         telethon_client,
         bot_entity,
@@ -130,7 +138,7 @@ async def test_model_switch_to_sonnet_and_execute_task_live(
     )
 
     assert switch_response.text is not None
-    print(f"[SONNET TEST] Switch response: {switch_response.text[:200]}...")
+    logger.debug("[SONNET TEST] Switch response: %s...", switch_response.text[:200])
 
     # Verify switch confirmation
     assert_contains(
@@ -138,10 +146,10 @@ async def test_model_switch_to_sonnet_and_execute_task_live(
         "Model changed",
         "Sonnet",
     )
-    print("[SONNET TEST] ✓ Model switch confirmed")
+    logger.debug("[SONNET TEST] ✓ Model switch confirmed")
 
     # Step 2: Execute a balanced task suitable for Sonnet
-    print("[SONNET TEST] Step 2: Executing balanced coding task...")
+    logger.debug("[SONNET TEST] Step 2: Executing balanced coding task...")
     task_message = "List 5 practical tips for writing better Python code. Be concise."
 
     task_responses = await send_and_collect_responses(
@@ -153,25 +161,29 @@ async def test_model_switch_to_sonnet_and_execute_task_live(
     )
 
     assert len(task_responses) > 0, "No response received from Sonnet model"
-    print(f"[SONNET TEST] Received {len(task_responses)} response(s)")
+    logger.debug("[SONNET TEST] Received %s response(s)", len(task_responses))
 
     # Verify we got a substantive response
     first_response = task_responses[0].text or ""
-    print(f"[SONNET TEST] First response preview: {first_response[:300]}...")
+    logger.debug("[SONNET TEST] First response preview: %s...", first_response[:300])
 
     # Should contain list of tips
     assert len(first_response) > 80, "Response too short"
     # Should mention Python or coding concepts
-    assert any(
-        keyword in first_response.lower()
-        for keyword in ["python", "code", "tip", "1.", "1)"]
-    ), "Response doesn't appear to contain tips"
+    assert_any(
+        first_response,
+        "python",
+        "code",
+        "tip",
+        "1.",
+        "1)",
+        message="Response doesn't appear to contain tips",
+    )
 
-    print("[SONNET TEST] ✓ Sonnet model successfully processed balanced task")
+    logger.debug("[SONNET TEST] ✓ Sonnet model successfully processed balanced task")
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_model_switch_to_haiku_and_execute_task_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -192,7 +204,7 @@ async def test_model_switch_to_haiku_and_execute_task_live(
     - Bot can handle simple tasks quickly with Haiku
     """
     # Step 1: Switch to Haiku
-    print("\n[HAIKU TEST] Step 1: Switching to Haiku 4.5...")
+    logger.debug("[HAIKU TEST] Step 1: Switching to Haiku 4.5...")
     switch_response = await send_message_and_wait(
         telethon_client,
         bot_entity,
@@ -201,7 +213,7 @@ async def test_model_switch_to_haiku_and_execute_task_live(
     )
 
     assert switch_response.text is not None
-    print(f"[HAIKU TEST] Switch response: {switch_response.text[:200]}...")
+    logger.debug("[HAIKU TEST] Switch response: %s...", switch_response.text[:200])
 
     # Verify switch confirmation
     assert_contains(
@@ -209,10 +221,10 @@ async def test_model_switch_to_haiku_and_execute_task_live(
         "Model changed",
         "Haiku",
     )
-    print("[HAIKU TEST] ✓ Model switch confirmed")
+    logger.debug("[HAIKU TEST] ✓ Model switch confirmed")
 
     # Step 2: Execute a simple task suitable for Haiku (fast response)
-    print("[HAIKU TEST] Step 2: Executing simple calculation task...")
+    logger.debug("[HAIKU TEST] Step 2: Executing simple calculation task...")
     task_message = "What is 42 + 58? Just give me the answer."
 
     task_responses = await send_and_collect_responses(
@@ -221,22 +233,22 @@ async def test_model_switch_to_haiku_and_execute_task_live(
         task_message,
         timeout=60,  # Haiku should be fast
         max_messages=5,
+        stop_when=lambda msg: "100" in (msg.text or ""),
     )
 
     assert len(task_responses) > 0, "No response received from Haiku model"
-    print(f"[HAIKU TEST] Received {len(task_responses)} response(s)")
+    logger.debug("[HAIKU TEST] Received %s response(s)", len(task_responses))
 
     # Verify we got a response with the answer
     first_response = task_responses[0].text or ""
-    print(f"[HAIKU TEST] First response: {first_response}")
+    logger.debug("[HAIKU TEST] First response: %s", first_response)
 
     # Should contain the answer 100
     assert "100" in first_response, "Response doesn't contain correct answer (100)"
-    print("[HAIKU TEST] ✓ Haiku model successfully processed simple task quickly")
+    logger.debug("[HAIKU TEST] ✓ Haiku model successfully processed simple task quickly")
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_model_verification_via_status_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -253,30 +265,27 @@ async def test_model_verification_via_status_live(
     - Model information is displayed in /status
     - The displayed model matches the last switch
     """
-    # Step 1: Switch to Sonnet (known state)
-    print("\n[STATUS TEST] Step 1: Switching to Sonnet for verification...")
-    switch_response = await send_message_and_wait(
-        telethon_client,
-        bot_entity,
-        "/model sonnet",
-        timeout=30,
-    )
-
-    assert switch_response.text is not None
-    assert_contains(switch_response.text, "Model changed", "Sonnet")
-    print("[STATUS TEST] ✓ Switched to Sonnet")
-
-    # Step 2: Check status
-    print("[STATUS TEST] Step 2: Checking /status...")
-    status_response = await send_message_and_wait(
-        telethon_client,
-        bot_entity,
-        "/status",
-        timeout=30,
-    )
+    # One reply stream for both commands; /status goes out as soon as the
+    # switch is confirmed
+    async with bot_replies(telethon_client, bot_entity) as replies:
+        # Step 1: Switch to Sonnet (known state)
+        logger.debug("[STATUS TEST] Step 1: Switching to Sonnet for verification...")
+        sent = await telethon_client.send_message(input_peer(bot_entity), "/model sonnet")
+        replies.after_id = sent.id
+        switch_response = await replies.get(30)
+
+        assert switch_response.text is not None
+        assert_contains(switch_response.text, "Model changed", "Sonnet")
+        logger.debug("[STATUS TEST] ✓ Switched to Sonnet")
+
+        # Step 2: Check status
+        logger.debug("[STATUS TEST] Step 2: Checking /status...")
+        sent = await telethon_client.send_message(input_peer(bot_entity), "/status")
+        replies.after_id = sent.id
+        status_response = await replies.get(30)
 
     assert status_response.text is not None
-    print(f"[STATUS TEST] Status response: {status_response.text}")
+    logger.debug("[STATUS TEST] Status response: %s", status_response.text)
 
     # Verify status shows the model
     assert_contains(
@@ -287,11 +296,10 @@ async def test_model_verification_via_status_live(
     # Should show Sonnet since we just switched to it
     assert "Sonnet" in status_response.text, "Status doesn't show current model (Sonnet)"
 
-    print("[STATUS TEST] ✓ Status correctly shows current model")
+    logger.debug("[STATUS TEST] ✓ Status correctly shows current model")
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_model_persistence_across_messages_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -310,7 +318,7 @@ async def test_model_persistence_across_messages_live(
     - No need to re-select model for each message
     """
     # Step 1: Switch to Haiku
-    print("\n[PERSIST TEST] Step 1: Switching to Haiku...")
+    logger.debug("[PERSIST TEST] Step 1: Switching to Haiku...")
     switch_response = await send_message_and_wait(
         telethon_client,
         bot_entity,
@@ -320,36 +328,38 @@ async def test_model_persistence_across_messages_live(
 
     assert switch_response.text is not None
     assert_contains(switch_response.text, "Model changed", "Haiku")
-    print("[PERSIST TEST] ✓ Switched to Haiku")
+    logger.debug("[PERSIST TEST] ✓ Switched to Haiku")
 
     # Step 2: Send first task
-    print("[PERSIST TEST] Step 2: Sending first task...")
+    logger.debug("[PERSIST TEST] Step 2: Sending first task...")
     task1_responses = await send_and_collect_responses(
         telethon_client,
         bot_entity,
         "What is 10 + 15?",
         timeout=60,
         max_messages=5,
+        stop_when=lambda msg: "25" in (msg.text or ""),
     )
 
     assert len(task1_responses) > 0
     first_task_response = task1_responses[0].text or ""
     assert "25" in first_task_response
-    print("[PERSIST TEST] ✓ First task processed")
+    logger.debug("[PERSIST TEST] ✓ First task processed")
 
     # Step 3: Send second task WITHOUT switching model
-    print("[PERSIST TEST] Step 3: Sending second task (no model switch)...")
+    logger.debug("[PERSIST TEST] Step 3: Sending second task (no model switch)...")
     task2_responses = await send_and_collect_responses(
         telethon_client,
         bot_entity,
         "What is 20 + 30?",
         timeout=60,
         max_messages=5,
+        stop_when=lambda msg: "50" in (msg.text or ""),
     )
 
     assert len(task2_responses) > 0
     second_task_response = task2_responses[0].text or ""
     assert "50" in second_task_response
-    print("[PERSIST TEST] ✓ Second task processed with same model")
+    logger.debug("[PERSIST TEST] ✓ Second task processed with same model")
 
-    print("[PERSIST TEST] ✓ Model persists across multiple messages")
+    logger.debug("[PERSIST TEST] ✓ Model persists across multiple messages")
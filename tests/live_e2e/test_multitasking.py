@@ -26,7 +26,6 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_sessions_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -53,7 +52,6 @@ async def test_sessions_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_create_named_session_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -90,7 +88,6 @@ async def test_create_named_session_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_switch_between_sessions_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -144,7 +141,6 @@ async def test_switch_between_sessions_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_kill_session_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -196,7 +192,6 @@ async def test_kill_session_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_sessions_list_display_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -238,7 +233,6 @@ async def test_sessions_list_display_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_default_session_on_new_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -271,7 +265,6 @@ async def test_default_session_on_new_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_session_persistence_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -322,7 +315,6 @@ async def test_session_persistence_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_session_isolation_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -372,7 +364,6 @@ async def test_session_isolation_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_status_shows_active_session_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -31,7 +31,6 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_safe_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -62,7 +61,6 @@ async def test_safe_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_moderate_command_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -89,7 +87,6 @@ async def test_moderate_command_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_dangerous_command_prompt_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -126,7 +123,6 @@ async def test_dangerous_command_prompt_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_dangerous_command_cancel_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -174,7 +170,6 @@ async def test_dangerous_command_cancel_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_critical_command_exact_phrase_prompt_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -228,7 +223,6 @@ async def test_critical_command_exact_phrase_prompt_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_confirmation_timeout_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -267,7 +261,6 @@ async def test_confirmation_timeout_live(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_safe_after_dangerous_cancel_live(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -25,7 +25,6 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_verbose_command_toggle_enable(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -52,7 +51,6 @@ async def test_verbose_command_toggle_enable(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_verbose_command_toggle_disable(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -80,7 +78,6 @@ async def test_verbose_command_toggle_disable(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_verbose_mode_shows_actions(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -137,7 +134,6 @@ async def test_verbose_mode_shows_actions(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_verbose_mode_in_help(
     telethon_client: "TelegramClient",
     bot_entity: "User",
@@ -164,7 +160,6 @@ async def test_verbose_mode_in_help(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio(loop_scope="session")
 async def test_verbose_toggle_sequence(
     telethon_client: "TelegramClient",
     bot_entity: "User",
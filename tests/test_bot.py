@@ -457,6 +457,14 @@ class TestOnShutdown:
         # Should not raise any exceptions
         await on_shutdown()
 
+    @pytest.mark.asyncio
+    async def test_shuts_down_archive_pool(self) -> None:
+        """Should stop the file sender's archive worker processes."""
+        with patch("jarvis_mk1_lite.bot.shutdown_archive_pool") as mock_shutdown:
+            await on_shutdown()
+
+        mock_shutdown.assert_called_once()
+
 
 class TestSetupBot:
     """Tests for setup_bot function."""
@@ -5,7 +5,15 @@ Tests FileSender class for sending files to Telegram users.
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import glob
+import random
+import tarfile
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,9 +25,17 @@ from jarvis_mk1_lite.exceptions import (
     FileTooLargeError,
 )
 from jarvis_mk1_lite.file_sender import (
+    MAX_FILE_REQUESTS_PER_RESPONSE,
+    SEND_MIN_INTERVAL,
+    UPLOAD_CHUNK_SIZE,
     FileRequest,
     FileSender,
     SendResult,
+    _copy_file_data,
+    _get_archive_semaphore,
+    _glob_re,
+    _write_zip_libdeflate,
+    shutdown_archive_pool,
 )
 
 
@@ -39,6 +55,12 @@ class TestFileSenderValidation:
         assert path.is_absolute()
         assert "~" not in str(path)
 
+    def test_normalize_path_collapses_parent_refs(self) -> None:
+        """Test path normalization collapses '..' without resolving symlinks."""
+        sender = FileSender()
+        path = sender._normalize_path("/tmp/a/../b/./test.txt")
+        assert path == Path("/tmp/b/test.txt")
+
     def test_validate_existing_file(self) -> None:
         """Test validation passes for existing file."""
         sender = FileSender()
@@ -53,6 +75,24 @@ class TestFileSenderValidation:
         finally:
             temp_path.unlink()
 
+    def test_validate_file_returns_stat(self, tmp_path: Path) -> None:
+        """Test validation returns the stat result for reuse."""
+        sender = FileSender()
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"12345")
+
+        st = sender._validate_file(file_path)
+
+        assert st.st_size == 5
+
+    def test_validate_permission_denied_on_stat(self) -> None:
+        """Test validation maps stat permission errors to access denied."""
+        sender = FileSender()
+
+        with patch.object(Path, "stat", side_effect=PermissionError):
+            with pytest.raises(FileAccessDeniedError):
+                sender._validate_file(Path("/restricted/file.txt"))
+
     def test_validate_nonexistent_file_raises(self) -> None:
         """Test validation raises for non-existent file."""
         sender = FileSender()
@@ -69,6 +109,30 @@ class TestFileSenderValidation:
                 sender._validate_file(Path(temp_dir))
             assert "Not a file" in str(exc_info.value)
 
+    def test_validate_unreadable_file_raises(self, tmp_path: Path) -> None:
+        """Test validation raises when the file is not readable."""
+        sender = FileSender()
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("content")
+
+        with patch("jarvis_mk1_lite.file_sender.os.access", return_value=False):
+            with pytest.raises(FileAccessDeniedError):
+                sender._validate_file(file_path)
+
+    def test_validate_probe_read_access(self, tmp_path: Path) -> None:
+        """Test probe mode reads the file instead of calling os.access."""
+        sender = FileSender(probe_read_access=True)
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("content")
+
+        with patch("jarvis_mk1_lite.file_sender.os.access") as mock_access:
+            sender._validate_file(file_path)
+            with patch("builtins.open", side_effect=PermissionError):
+                with pytest.raises(FileAccessDeniedError, match="permission denied"):
+                    sender._validate_file(file_path)
+
+        mock_access.assert_not_called()
+
     def test_check_sensitive_file_env(self) -> None:
         """Test sensitive file detection for .env."""
         sender = FileSender()
@@ -87,6 +151,39 @@ class TestFileSenderValidation:
         assert sender._check_sensitive_file(Path("/app/private_key.pem"))
         assert sender._check_sensitive_file(Path("/app/api_key.txt"))
 
+    def test_check_sensitive_file_in_directory(self) -> None:
+        """Test files inside sensitive directories are flagged."""
+        sender = FileSender()
+        assert sender._check_sensitive_file(Path("/app/.env.d/settings.yaml"))
+        assert sender._check_sensitive_file(Path("/home/user/key_store/data.bin"))
+
+    def test_check_sensitive_file_symlink_target(self, tmp_path: Path) -> None:
+        """Test a symlink pointing at a sensitive file is flagged."""
+        sender = FileSender()
+        secret = tmp_path / ".env"
+        secret.write_text("TOKEN=1")
+        link = tmp_path / "notes.txt"
+        link.symlink_to(secret)
+
+        assert sender._check_sensitive_file(link)
+
+    def test_check_sensitive_file_symlinked_directory(self, tmp_path: Path) -> None:
+        """Test a file reached through a symlink to a sensitive directory is flagged."""
+        sender = FileSender()
+        secret_dir = tmp_path / ".env.d"
+        secret_dir.mkdir()
+        (secret_dir / "settings.yml").write_text("token: 1")
+        link = tmp_path / "cfg"
+        link.symlink_to(secret_dir)
+
+        assert sender._check_sensitive_file(link / "settings.yml")
+
+    def test_check_sensitive_file_case_insensitive(self) -> None:
+        """Test sensitive file detection ignores case."""
+        sender = FileSender()
+        assert sender._check_sensitive_file(Path("/app/Secret.TXT"))
+        assert sender._check_sensitive_file(Path("/app/.ENV/config.yaml"))
+
     def test_check_non_sensitive_file(self) -> None:
         """Test non-sensitive file is not flagged."""
         sender = FileSender()
@@ -112,7 +209,8 @@ class TestFileSenderSize:
         finally:
             temp_path.unlink()
 
-    def test_compress_file(self) -> None:
+    @pytest.mark.asyncio
+    async def test_compress_file(self) -> None:
         """Test file compression creates smaller file."""
         sender = FileSender()
 
@@ -122,7 +220,7 @@ class TestFileSenderSize:
             temp_path = Path(f.name)
 
         try:
-            zip_path, original_name = sender._compress_file(temp_path)
+            zip_path, original_name = await sender._compress_file(temp_path)
             assert zip_path.exists()
             assert zip_path.suffix == ".zip"
             # ZIP should be smaller (or at least exist)
@@ -133,6 +231,341 @@ class TestFileSenderSize:
         finally:
             temp_path.unlink()
 
+    def test_compressed_names_are_unique(self, tmp_path: Path) -> None:
+        """Test repeated compressions never reuse an archive path."""
+        sender = FileSender(temp_dir=str(tmp_path / "temp"))
+        source = tmp_path / "data.txt"
+        source.write_text("data")
+
+        paths = {sender._compress_file_sync(source)[0] for _ in range(5)}
+
+        assert len(paths) == 5
+        assert all(p.name.startswith("data_") and p.suffix == ".zip" for p in paths)
+
+    def test_temp_dir_created_once(self, tmp_path: Path) -> None:
+        """Test the temp directory is created on first compression only."""
+        temp_dir = tmp_path / "temp"
+        sender = FileSender(temp_dir=str(temp_dir))
+        source = tmp_path / "data.txt"
+        source.write_text("data")
+
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            sender._compress_file_sync(source)
+            sender._compress_files_sync([source], "archive")
+
+        assert temp_dir.is_dir()
+        mock_mkdir.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_compress_files_runs_in_process_pool(self, tmp_path: Path) -> None:
+        """Test archive creation is offloaded to a worker process."""
+        sender = FileSender(temp_dir=str(tmp_path / "temp"))
+        source = tmp_path / "data.txt"
+        source.write_text("content")
+
+        zip_path = await sender._compress_files([source], "archive")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.read("data.txt") == b"content"
+
+    @pytest.mark.asyncio
+    async def test_compress_files_uses_shared_pool(self, tmp_path: Path) -> None:
+        """Test archive creation goes through the shared archive pool."""
+        sender = FileSender(temp_dir=str(tmp_path / "temp"))
+        source = tmp_path / "data.txt"
+        source.write_text("content")
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as pool,
+            patch("jarvis_mk1_lite.file_sender.ARCHIVE_PROCESS_MIN_BYTES", 0),
+            patch(
+                "jarvis_mk1_lite.file_sender._get_archive_pool", return_value=pool
+            ) as mock_get_pool,
+        ):
+            zip_path = await sender._compress_files([source], "archive")
+
+        mock_get_pool.assert_called_once()
+        assert zip_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_compress_files_broken_pool_falls_back(self, tmp_path: Path) -> None:
+        """Test a broken process pool is replaced and the archive still built."""
+        sender = FileSender(temp_dir=str(tmp_path / "temp"))
+        source = tmp_path / "data.txt"
+        source.write_text("content")
+        broken_pool = MagicMock()
+        broken_pool.submit.side_effect = BrokenProcessPool("worker died")
+
+        with (
+            patch("jarvis_mk1_lite.file_sender.ARCHIVE_PROCESS_MIN_BYTES", 0),
+            patch("jarvis_mk1_lite.file_sender._get_archive_pool", return_value=broken_pool),
+            patch("jarvis_mk1_lite.file_sender._reset_archive_pool") as mock_reset,
+        ):
+            zip_path = await sender._compress_files([source], "archive")
+
+        mock_reset.assert_called_once()
+        assert zip_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_compress_small_files_skips_pool(self, tmp_path: Path) -> None:
+        """Test inputs below the process threshold are archived in a thread."""
+        sender = FileSender(temp_dir=str(tmp_path / "temp"))
+        source = tmp_path / "data.txt"
+        source.write_text("content")
+
+        with patch("jarvis_mk1_lite.file_sender._get_archive_pool") as mock_get_pool:
+            zip_path = await sender._compress_files([source], "archive")
+
+        mock_get_pool.assert_not_called()
+        assert zip_path.exists()
+
+    def test_archive_semaphore_is_per_loop(self) -> None:
+        """Test each event loop gets its own archive semaphore."""
+
+        async def get_semaphore() -> asyncio.Semaphore:
+            return _get_archive_semaphore()
+
+        first = asyncio.run(get_semaphore())
+        second = asyncio.run(get_semaphore())
+
+        assert first is not second
+
+    def test_shutdown_archive_pool(self) -> None:
+        """Test shutdown waits for the pool and clears it."""
+        pool = MagicMock()
+
+        with patch("jarvis_mk1_lite.file_sender._archive_pool", pool):
+            shutdown_archive_pool()
+            shutdown_archive_pool()
+
+        pool.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+
+
+class TestFileSenderPrecompressed:
+    """Tests for skipping recompression of already-compressed formats."""
+
+    @pytest.mark.parametrize("use_libdeflate", [True, False])
+    def test_precompressed_entries_are_stored(self, tmp_path: Path, use_libdeflate: bool) -> None:
+        """Test already-compressed files are stored, others deflated."""
+        sender = FileSender(temp_dir=str(tmp_path))
+        image = tmp_path / "photo.JPG"
+        image.write_bytes(b"\xff\xd8" * 512)
+        text = tmp_path / "notes.txt"
+        text.write_bytes(b"notes " * 512)
+
+        modules = {} if use_libdeflate else {"deflate": None}
+        with patch.dict("sys.modules", modules):
+            zip_path = sender._compress_files_sync([image, text], "archive")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert zf.getinfo("photo.JPG").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("notes.txt").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("photo.JPG") == image.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_send_large_precompressed_file_skips_compression(self, tmp_path: Path) -> None:
+        """Test oversized already-compressed files fail fast."""
+        sender = FileSender(max_file_size_mb=0.001, temp_dir=str(tmp_path))
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"\x00" * 4096)
+        message = MagicMock()
+        message.answer_document = AsyncMock()
+
+        with patch.object(sender, "_compress_file") as mock_compress:
+            with pytest.raises(FileTooLargeError, match="already compressed"):
+                await sender.send_file(message, str(video))
+
+        mock_compress.assert_not_called()
+        message.answer_document.assert_not_called()
+
+
+class TestCopyFileData:
+    """Tests for in-kernel copying of stored archive entries."""
+
+    def test_copy_file_data(self, tmp_path: Path) -> None:
+        """Test data is appended after what was already written."""
+        src_path = tmp_path / "src.bin"
+        src_path.write_bytes(bytes(range(256)) * 100)
+        dst_path = tmp_path / "dst.bin"
+
+        with open(src_path, "rb", buffering=0) as src, open(dst_path, "wb") as dst:
+            dst.write(b"header")
+            _copy_file_data(src, dst, src_path.stat().st_size)
+            dst.write(b"trailer")
+
+        assert dst_path.read_bytes() == b"header" + src_path.read_bytes() + b"trailer"
+
+    def test_copy_file_data_falls_back(self, tmp_path: Path) -> None:
+        """Test a plain copy is used when copy_file_range is unsupported."""
+        src_path = tmp_path / "src.bin"
+        src_path.write_bytes(b"x" * 5000)
+        dst_path = tmp_path / "dst.bin"
+
+        with (
+            patch(
+                "jarvis_mk1_lite.file_sender.os.copy_file_range",
+                side_effect=OSError(errno.EXDEV, "cross-device"),
+                create=True,
+            ),
+            open(src_path, "rb", buffering=0) as src,
+            open(dst_path, "wb") as dst,
+        ):
+            _copy_file_data(src, dst, 5000)
+
+        assert dst_path.read_bytes() == b"x" * 5000
+
+    def test_copy_file_data_fallback_stops_at_size(self, tmp_path: Path) -> None:
+        """Test the plain copy ignores bytes past size, e.g. from a growing file."""
+        src_path = tmp_path / "src.bin"
+        src_path.write_bytes(b"x" * 5000 + b"appended")
+        dst_path = tmp_path / "dst.bin"
+
+        with (
+            patch(
+                "jarvis_mk1_lite.file_sender.os.copy_file_range",
+                side_effect=OSError(errno.EXDEV, "cross-device"),
+                create=True,
+            ),
+            open(src_path, "rb", buffering=0) as src,
+            open(dst_path, "wb") as dst,
+        ):
+            _copy_file_data(src, dst, 5000)
+
+        assert dst_path.read_bytes() == b"x" * 5000
+
+
+class TestFileSenderZstdArchive:
+    """Tests for tar.zst multi-file archives."""
+
+    def test_invalid_archive_format_raises(self) -> None:
+        """Test unknown archive formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported archive format"):
+            FileSender(archive_format="rar")
+
+    def test_tar_zst_archive_round_trip(self, tmp_path: Path) -> None:
+        """Test tar.zst archive contains all files."""
+        zstandard = pytest.importorskip("zstandard")
+        sender = FileSender(temp_dir=str(tmp_path), archive_format="tar.zst")
+        files = []
+        for i in range(3):
+            file_path = tmp_path / f"module{i}.py"
+            file_path.write_text(f"def func{i}():\n    return {i}\n")
+            files.append(file_path)
+
+        archive_path = sender._compress_files_sync(files, "archive")
+
+        assert archive_path.name.endswith(".tar.zst")
+        with (
+            open(archive_path, "rb") as fp,
+            zstandard.ZstdDecompressor().stream_reader(fp) as reader,
+            tarfile.open(fileobj=reader, mode="r|") as tar,
+        ):
+            contents = {
+                member.name: tar.extractfile(member).read()  # type: ignore[union-attr]
+                for member in tar
+            }
+        assert contents == {f.name: f.read_bytes() for f in files}
+
+    def test_tar_zst_stores_symlink_content(self, tmp_path: Path) -> None:
+        """Test symlinked inputs are archived as file content, not links."""
+        zstandard = pytest.importorskip("zstandard")
+        sender = FileSender(temp_dir=str(tmp_path), archive_format="tar.zst")
+        real = tmp_path / "real.txt"
+        real.write_text("real content")
+        link = tmp_path / "link.txt"
+        link.symlink_to(real)
+
+        archive_path = sender._compress_files_sync([link], "archive")
+
+        with (
+            open(archive_path, "rb") as fp,
+            zstandard.ZstdDecompressor().stream_reader(fp) as reader,
+            tarfile.open(fileobj=reader, mode="r|") as tar,
+        ):
+            member = tar.next()
+            assert member is not None
+            assert member.name == "link.txt"
+            assert member.isfile()
+            assert tar.extractfile(member).read() == b"real content"  # type: ignore[union-attr]
+
+    def test_tar_zst_falls_back_to_zip(self, tmp_path: Path) -> None:
+        """Test ZIP is used when zstandard is not installed."""
+        sender = FileSender(temp_dir=str(tmp_path), archive_format="tar.zst")
+        file_path = tmp_path / "data.txt"
+        file_path.write_text("data")
+
+        with patch.dict("sys.modules", {"zstandard": None}):
+            archive_path = sender._compress_files_sync([file_path], "archive")
+
+        assert archive_path.suffix == ".zip"
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.read("data.txt") == b"data"
+
+
+class TestFileSenderLibdeflate:
+    """Tests for the libdeflate-backed ZIP writer."""
+
+    def test_libdeflate_archive_is_valid_zip(self, tmp_path: Path) -> None:
+        """Test archive written with libdeflate is readable by zipfile."""
+        pytest.importorskip("deflate")
+        sender = FileSender(temp_dir=str(tmp_path))
+        first = tmp_path / "first.txt"
+        first.write_bytes(b"hello world\n" * 1000)
+        second = tmp_path / "второй.txt"
+        second.write_bytes(b"")
+
+        zip_path = sender._compress_files_sync([first, second], "archive")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == ["first.txt", "второй.txt"]
+            assert zf.read("first.txt") == first.read_bytes()
+            assert zf.read("второй.txt") == b""
+            assert zf.getinfo("first.txt").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_falls_back_to_zipfile_without_deflate(self, tmp_path: Path) -> None:
+        """Test stdlib zipfile is used when deflate is not installed."""
+        sender = FileSender(temp_dir=str(tmp_path))
+        source = tmp_path / "data.txt"
+        source.write_bytes(b"a" * 1024)
+
+        with patch.dict("sys.modules", {"deflate": None}):
+            zip_path, _ = sender._compress_file_sync(source)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.read("data.txt") == b"a" * 1024
+
+    def test_zipfile_fallback_uses_compresslevel(self, tmp_path: Path) -> None:
+        """Test the configured level changes the stdlib zipfile output."""
+        rng = random.Random(0)
+        words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+        source = tmp_path / "data.txt"
+        source.write_text(" ".join(rng.choice(words) for _ in range(100_000)))
+
+        sizes = {}
+        for level in (1, 9):
+            sender = FileSender(temp_dir=str(tmp_path / f"level{level}"), compresslevel=level)
+            with patch.dict("sys.modules", {"deflate": None}):
+                zip_path, _ = sender._compress_file_sync(source)
+            with zipfile.ZipFile(zip_path) as zf:
+                assert zf.read("data.txt") == source.read_bytes()
+            sizes[level] = zip_path.stat().st_size
+
+        assert sizes[9] < sizes[1]
+
+    def test_default_compresslevel_is_fastest(self) -> None:
+        """Test compression defaults to the fastest level."""
+        assert FileSender().compresslevel == 1
+
+    def test_falls_back_to_zipfile_for_large_inputs(self, tmp_path: Path) -> None:
+        """Test inputs above the in-memory limit skip libdeflate."""
+        source = tmp_path / "data.txt"
+        source.write_bytes(b"a" * 1024)
+
+        with patch("jarvis_mk1_lite.file_sender.LIBDEFLATE_MAX_INPUT_BYTES", 10):
+            assert not _write_zip_libdeflate(tmp_path / "out.zip", [(source, "data.txt")])
+
 
 class TestFileSenderSend:
     """Tests for file sending."""
@@ -166,6 +599,23 @@ class TestFileSenderSend:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.asyncio
+    async def test_send_file_uses_large_upload_chunks(self, mock_message: MagicMock) -> None:
+        """Test uploads read the file in large chunks."""
+        sender = FileSender()
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
+            f.write(b"test content")
+            temp_path = f.name
+
+        try:
+            await sender.send_file(mock_message, temp_path)
+
+            document = mock_message.answer_document.call_args[1]["document"]
+            assert document.chunk_size == UPLOAD_CHUNK_SIZE
+        finally:
+            Path(temp_path).unlink()
+
     @pytest.mark.asyncio
     async def test_send_file_with_caption(self, mock_message: MagicMock) -> None:
         """Test file send with custom caption."""
@@ -216,6 +666,99 @@ class TestFileSenderSend:
             for path in temp_files:
                 Path(path).unlink()
 
+    @pytest.mark.asyncio
+    async def test_send_files_sends_in_order_paced(self, mock_message: MagicMock) -> None:
+        """Test individual sends go one at a time, in order, spaced per chat."""
+        sender = FileSender()
+        sent: list[str] = []
+
+        async def record_send(message: MagicMock, file_path: str) -> SendResult:
+            sent.append(file_path)
+            return SendResult(success=True, file_path=file_path)
+
+        temp_files = []
+        try:
+            for i in range(3):
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
+                    f.write(f"content {i}".encode())
+                    temp_files.append(f.name)
+
+            with (
+                patch.object(sender, "send_file", side_effect=record_send),
+                patch("jarvis_mk1_lite.file_sender.time.monotonic", return_value=100.0),
+                patch("jarvis_mk1_lite.file_sender.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+            ):
+                results = await sender.send_files(mock_message, temp_files, archive_if_many=False)
+
+            assert sent == temp_files
+            assert [r.file_path for r in results] == temp_files
+            assert [c.args[0] for c in mock_sleep.await_args_list] == [
+                SEND_MIN_INTERVAL,
+                2 * SEND_MIN_INTERVAL,
+            ]
+        finally:
+            for path in temp_files:
+                Path(path).unlink()
+
+    @pytest.mark.asyncio
+    async def test_chat_slots_are_per_chat(self) -> None:
+        """Test pacing one chat does not delay another."""
+        sender = FileSender()
+
+        with (
+            patch("jarvis_mk1_lite.file_sender.time.monotonic", return_value=100.0),
+            patch("jarvis_mk1_lite.file_sender.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            await sender._wait_for_chat_slot(1)
+            await sender._wait_for_chat_slot(2)
+            mock_sleep.assert_not_awaited()
+            await sender._wait_for_chat_slot(1)
+
+        mock_sleep.assert_awaited_once_with(SEND_MIN_INTERVAL)
+
+    @pytest.mark.asyncio
+    async def test_chat_slots_expire(self) -> None:
+        """Test chats whose slot has passed are dropped from the map."""
+        sender = FileSender()
+
+        with patch("jarvis_mk1_lite.file_sender.time.monotonic", return_value=100.0):
+            await sender._wait_for_chat_slot(1)
+            await sender._wait_for_chat_slot(2)
+        with patch(
+            "jarvis_mk1_lite.file_sender.time.monotonic",
+            return_value=100.0 + SEND_MIN_INTERVAL,
+        ):
+            await sender._wait_for_chat_slot(3)
+
+        assert list(sender._chat_next_send) == [3]
+
+    @pytest.mark.asyncio
+    async def test_send_files_reports_invalid_paths(self, mock_message: MagicMock) -> None:
+        """Test invalid paths are reported while valid ones are still sent."""
+        sender = FileSender()
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
+            f.write(b"content")
+            valid_path = f.name
+
+        try:
+            results = await sender.send_files(
+                mock_message,
+                ["/nonexistent/a.txt", valid_path, "/nonexistent/b.txt"],
+                archive_if_many=False,
+            )
+
+            # Results keep the input order, failures included
+            assert [r.file_path for r in results] == [
+                "/nonexistent/a.txt",
+                valid_path,
+                "/nonexistent/b.txt",
+            ]
+            assert [r.success for r in results] == [False, True, False]
+            mock_message.answer_document.assert_called_once()
+        finally:
+            Path(valid_path).unlink()
+
     @pytest.mark.asyncio
     async def test_send_files_archive_many(self, mock_message: MagicMock) -> None:
         """Test that many files are archived."""
@@ -296,6 +839,41 @@ class TestFileSenderDirectory:
 
             assert len(results) == 2  # Only .txt files
 
+    def test_list_directory_skips_subdirectories(self, tmp_path: Path) -> None:
+        """Test directory listing returns only matching regular files."""
+        sender = FileSender()
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.py").write_text("b")
+        (tmp_path / "sub.txt").mkdir()
+
+        files = sender._list_directory(tmp_path, "*.txt")
+
+        assert files == [tmp_path / "a.txt"]
+
+    def test_list_directory_reuses_compiled_pattern(self, tmp_path: Path) -> None:
+        """Test the same pattern is compiled only once across listings."""
+        sender = FileSender()
+        (tmp_path / "a.txt").write_text("a")
+        _glob_re.cache_clear()
+
+        for _ in range(3):
+            assert sender._list_directory(tmp_path, "*.txt") == [tmp_path / "a.txt"]
+
+        info = _glob_re.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_list_directory_recursive_pattern(self, tmp_path: Path) -> None:
+        """Test recursive patterns still descend into subdirectories."""
+        sender = FileSender()
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.txt").write_text("b")
+
+        files = sender._list_directory(tmp_path, "**/*.txt")
+
+        assert sorted(files) == [tmp_path / "a.txt", tmp_path / "sub" / "b.txt"]
+
     @pytest.mark.asyncio
     async def test_send_directory_not_found(self, mock_message: MagicMock) -> None:
         """Test error handling for non-existent directory."""
@@ -334,6 +912,19 @@ class TestFileSenderGlob:
 
             assert len(results) == 2  # Only .py files
 
+    def test_expand_glob_matches_glob_module(self, tmp_path: Path) -> None:
+        """Test glob expansion agrees with glob.glob for files."""
+        sender = FileSender()
+        (tmp_path / "a.py").write_text("a")
+        (tmp_path / ".hidden.py").write_text("h")
+        (tmp_path / "dir.py").mkdir()
+        (tmp_path / "dir.py" / "b.py").write_text("b")
+
+        for pattern in ("*.py", ".*.py", "*/*.py", "**/*.py", "a.py", "missing/*.py"):
+            full = str(tmp_path / pattern)
+            expected = [p for p in glob.glob(full, recursive=True) if Path(p).is_file()]
+            assert sorted(sender._expand_glob(full)) == sorted(expected), pattern
+
     @pytest.mark.asyncio
     async def test_send_glob_no_matches(self, mock_message: MagicMock) -> None:
         """Test glob with no matches."""
@@ -461,3 +1052,18 @@ class TestProcessFileRequests:
             assert results[1].error is not None
         finally:
             Path(valid_path).unlink()
+
+    @pytest.mark.asyncio
+    async def test_process_requests_capped(self, mock_message: MagicMock) -> None:
+        """Test requests beyond the per-response limit are dropped."""
+        sender = FileSender()
+        requests = [
+            FileRequest(path=f"/nonexistent/file{i}.txt", request_type="file")
+            for i in range(MAX_FILE_REQUESTS_PER_RESPONSE + 5)
+        ]
+
+        with patch("jarvis_mk1_lite.file_sender.asyncio.sleep", new_callable=AsyncMock):
+            results = await sender.process_file_requests(mock_message, requests)
+
+        assert len(results) == MAX_FILE_REQUESTS_PER_RESPONSE
+        assert results[-1].file_path == requests[MAX_FILE_REQUESTS_PER_RESPONSE - 1].path
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from unittest.mock import patch
 
 import pytest
 
 from jarvis_mk1_lite.metrics import (
+    NUMPY_MIN_LATENCY_SAMPLES,
     HealthStatus,
     Metrics,
     RateLimiter,
@@ -99,7 +102,16 @@ class TestMetrics:
 
         assert len(fresh_metrics.latencies) == 5
         # Should keep the last 5 samples
-        assert fresh_metrics.latencies == [5.0, 6.0, 7.0, 8.0, 9.0]
+        assert list(fresh_metrics.latencies) == [5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_latencies_bounded_from_construction(self) -> None:
+        """Should bound the latency window to the configured sample count."""
+        m = Metrics(max_latency_samples=3)
+        for i in range(5):
+            m.record_latency(float(i))
+
+        assert m.latencies.maxlen == 3
+        assert list(m.latencies) == [2.0, 3.0, 4.0]
 
     def test_record_safety_check_safe(self, fresh_metrics: Metrics) -> None:
         """Should record safety checks without blocks."""
@@ -157,6 +169,44 @@ class TestMetrics:
         # P95 should be around 0.95
         assert 0.94 <= p95 <= 0.96
 
+    def test_latency_stats(self, fresh_metrics: Metrics) -> None:
+        """Should return average and P95 together."""
+        assert fresh_metrics._latency_stats() == (0.0, 0.0)
+        for i in range(1, 21):
+            fresh_metrics.record_latency(float(i))
+
+        assert fresh_metrics._latency_stats() == (10.5, 20.0)
+
+    def test_latency_array_skipped_for_small_windows(self, fresh_metrics: Metrics) -> None:
+        """Should stay on the pure-Python path below the numpy threshold."""
+        fresh_metrics.record_latency(1.0)
+        assert fresh_metrics._latency_array() is None
+
+    def test_latency_array_without_numpy(self) -> None:
+        """Should fall back to pure Python when numpy cannot be imported."""
+        m = Metrics(max_latency_samples=NUMPY_MIN_LATENCY_SAMPLES)
+        for i in range(NUMPY_MIN_LATENCY_SAMPLES):
+            m.record_latency(float(i))
+
+        with (
+            patch("jarvis_mk1_lite.metrics._numpy", None),
+            patch("jarvis_mk1_lite.metrics._numpy_missing", True),
+        ):
+            assert m._latency_array() is None
+            assert m.get_p95_latency() == float(int(NUMPY_MIN_LATENCY_SAMPLES * 0.95))
+
+    def test_latency_stats_numpy_matches_python(self) -> None:
+        """Should give the same average and P95 through numpy for large windows."""
+        pytest.importorskip("numpy")
+        m = Metrics(max_latency_samples=NUMPY_MIN_LATENCY_SAMPLES * 2)
+        for i in range(NUMPY_MIN_LATENCY_SAMPLES * 2):
+            m.record_latency(float((i * 37) % 101))
+
+        assert m._latency_array() is not None
+        samples = sorted(m.latencies)
+        assert m.get_p95_latency() == samples[int(len(samples) * 0.95)]
+        assert m.get_average_latency() == pytest.approx(sum(samples) / len(samples))
+
     def test_get_error_rate_no_requests(self, fresh_metrics: Metrics) -> None:
         """Should return 0.0 when no requests."""
         assert fresh_metrics.get_error_rate() == 0.0
@@ -271,6 +321,49 @@ class TestMetrics:
         assert 3 in fresh_metrics.user_request_counts
         assert 4 in fresh_metrics.user_request_counts
 
+    def test_lru_eviction_after_lowering_limit(self, fresh_metrics: Metrics) -> None:
+        """Should drop all stale users at once when the limit is lowered."""
+        for user_id in range(10):
+            fresh_metrics.record_request(user_id)
+
+        fresh_metrics.max_tracked_users = 3
+        fresh_metrics.record_request(10)
+
+        assert list(fresh_metrics.user_request_counts) == [8, 9, 10]
+
+    def test_sharded_user_counters(self) -> None:
+        """Should split users across shards and evict per shard."""
+        m = Metrics(user_shards=4, max_tracked_users=8)
+        for user_id in range(16):
+            m.record_request(user_id)
+        m.record_error(5)
+
+        # Each shard keeps its own 2 most recent users
+        assert m.get_active_users() == 8
+        assert set(m.user_request_counts) == set(range(8, 16))
+        assert m.user_error_counts == {5: 1}
+
+        m.reset()
+        assert m.get_active_users() == 0
+        assert len(m.user_error_counts) == 0
+
+    def test_invalid_user_shards(self) -> None:
+        """Should reject a shard count below 1."""
+        with pytest.raises(ValueError, match="user_shards"):
+            Metrics(user_shards=0)
+
+    @pytest.mark.asyncio
+    async def test_async_recorders_update_counters(self, fresh_metrics: Metrics) -> None:
+        """Async variants should forward to the synchronous recorders."""
+        await asyncio.gather(*(fresh_metrics.record_request_async(i % 3) for i in range(30)))
+        await fresh_metrics.record_error_async(1)
+        await fresh_metrics.record_latency_async(0.25)
+
+        assert fresh_metrics.total_requests == 30
+        assert fresh_metrics.user_request_counts == {0: 10, 1: 10, 2: 10}
+        assert fresh_metrics.user_error_counts == {1: 1}
+        assert list(fresh_metrics.latencies) == [0.25]
+
 
 class TestHealthStatus:
     """Tests for HealthStatus dataclass."""
@@ -382,12 +475,48 @@ class TestRateLimiter:
 
         # Manually set last update time to 4 seconds ago
         tokens, _ = fresh_limiter.buckets[123]
-        fresh_limiter.buckets[123] = (tokens, time.time() - 4)
+        fresh_limiter.buckets[123] = (tokens, time.monotonic() - 4)
 
         # Should have refilled (4 seconds * 0.5 rate = 2 tokens)
         remaining = fresh_limiter.get_remaining(123)
         assert remaining >= 1.5  # Allow some tolerance
 
+    def test_refill_takes_bucket_out(self, fresh_limiter: RateLimiter) -> None:
+        """Refill should leave storing the bucket back to the caller."""
+        fresh_limiter.is_allowed(123)
+        tokens, _ = fresh_limiter._refill(123)
+
+        assert 8.9 < tokens < 9.1
+        assert 123 not in fresh_limiter.buckets
+
+    def test_lru_eviction_buckets(self, fresh_limiter: RateLimiter) -> None:
+        """Should evict the least recently used bucket when over capacity."""
+        fresh_limiter.max_buckets = 3
+        for user_id in (1, 2, 3):
+            fresh_limiter.is_allowed(user_id)
+
+        # Touch user 1 so user 2 becomes the oldest
+        fresh_limiter.get_remaining(1)
+        fresh_limiter.is_allowed(4)
+
+        assert list(fresh_limiter.buckets) == [3, 1, 4]
+
+    def test_rejected_request_keeps_refilled_tokens(self, fresh_limiter: RateLimiter) -> None:
+        """A rejected request should store the refilled, unconsumed count."""
+        fresh_limiter.buckets[123] = (0.0, time.monotonic() - 1)
+
+        assert fresh_limiter.is_allowed(123, cost=5.0) is False
+        tokens, _ = fresh_limiter.buckets[123]
+        assert 0.5 <= tokens < 1.0
+
+    def test_wall_clock_jump_does_not_refill(self, fresh_limiter: RateLimiter) -> None:
+        """Wall-clock adjustments should not affect token refill."""
+        for _ in range(10):
+            fresh_limiter.is_allowed(123)
+
+        with patch("jarvis_mk1_lite.metrics.time.time", return_value=time.time() + 3600):
+            assert fresh_limiter.is_allowed(123) is False
+
     def test_reset_user(self, fresh_limiter: RateLimiter) -> None:
         """Should reset a user's bucket to full."""
         # Consume some tokens
@@ -475,6 +604,38 @@ class TestFormatMetricsMessage:
         """Reset global metrics before each test."""
         metrics.reset()
 
+    def test_format_metrics_message_cached_within_second(self) -> None:
+        """Should reuse the rendered message while counters are unchanged."""
+        with (
+            patch("jarvis_mk1_lite.metrics.time.monotonic", return_value=1000.0),
+            patch(
+                "jarvis_mk1_lite.metrics._render_metrics_message", return_value="rendered"
+            ) as render,
+        ):
+            assert format_metrics_message() == "rendered"
+            assert format_metrics_message() == "rendered"
+            assert render.call_count == 1
+
+            metrics.record_request(1)
+            format_metrics_message()
+            assert render.call_count == 2
+
+            format_metrics_message({"active_sessions": 1})
+            assert render.call_count == 3
+
+    def test_format_metrics_message_refreshed_next_second(self) -> None:
+        """Should re-render once the one-second bucket changes."""
+        with (
+            patch("jarvis_mk1_lite.metrics.time.monotonic", side_effect=[1000.0, 1001.0]),
+            patch(
+                "jarvis_mk1_lite.metrics._render_metrics_message", return_value="rendered"
+            ) as render,
+        ):
+            format_metrics_message()
+            format_metrics_message()
+
+        assert render.call_count == 2
+
     def test_format_metrics_message_basic(self) -> None:
         """Should format basic metrics message."""
         message = format_metrics_message()
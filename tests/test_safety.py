@@ -1,5 +1,11 @@
 """Tests for Socratic Gate safety module."""
 
+import re
+import sys
+from unittest.mock import patch
+
+import pytest
+
 from jarvis_mk1_lite.safety import (
     CRITICAL_PATTERNS,
     DANGEROUS_PATTERNS,
@@ -7,6 +13,8 @@ from jarvis_mk1_lite.safety import (
     RiskLevel,
     SafetyCheck,
     SocraticGate,
+    _compile_regex,
+    _get_compiled_tiers,
     is_user_allowed,
     socratic_gate,
 )
@@ -238,6 +246,11 @@ class TestSocraticGateCheck:
         assert result.risk_level == RiskLevel.MODERATE
         assert result.requires_confirmation is False
 
+    def test_moderate_case_insensitive(self) -> None:
+        """MODERATE patterns should match regardless of case."""
+        result = socratic_gate.check("Git Reset --HARD origin/main")
+        assert result.risk_level == RiskLevel.MODERATE
+
     def test_case_insensitive_matching(self) -> None:
         """Pattern matching should be case insensitive."""
         result = socratic_gate.check("DROP DATABASE MyDB;")
@@ -416,6 +429,45 @@ class TestPatternDefinitions:
             assert isinstance(pattern, str)
             assert isinstance(description, str)
 
+    def test_compiled_tiers_cover_definitions(self) -> None:
+        """Each tier regex should map every pattern back to its description."""
+        definitions_by_tier = (CRITICAL_PATTERNS, DANGEROUS_PATTERNS, MODERATE_PATTERNS)
+        for (regex, descs), definitions in zip(
+            _get_compiled_tiers(), definitions_by_tier, strict=True
+        ):
+            assert list(descs.values()) == [d for _, d in definitions]
+            assert set(descs) <= set(regex.groupindex)
+
+    def test_nested_group_reports_outer_description(self) -> None:
+        """Patterns with inner groups should still report their own description."""
+        gate = SocraticGate()
+        result = gate.check("systemctl stop sshd")
+        assert result.matched_pattern == "Stopping critical services"
+
+    def test_compiled_tiers_built_once(self) -> None:
+        """Tiers should be compiled lazily and then reused."""
+        with patch("jarvis_mk1_lite.safety._compiled_tiers", None):
+            first = _get_compiled_tiers()
+            assert _get_compiled_tiers() is first
+
+    def test_compile_regex_falls_back_to_stdlib(self) -> None:
+        """Should use the re module when google-re2 is not installed."""
+        with patch.dict(sys.modules, {"re2": None}):
+            regex = _compile_regex(r"rm\s+-rf")
+
+        assert isinstance(regex, re.Pattern)
+        assert regex.search("RM -RF /tmp")
+
+    def test_compile_regex_uses_re2_when_available(self) -> None:
+        """Should compile with RE2 when google-re2 is installed."""
+        pytest.importorskip("re2")
+        regex = _compile_regex(r"(?P<d0>rm\s+-rf)")
+
+        assert not isinstance(regex, re.Pattern)
+        match = regex.search("RM -RF /tmp")
+        assert match is not None
+        assert match.lastgroup == "d0"
+
 
 class TestSocraticGateSingleton:
     """Tests for socratic_gate singleton."""
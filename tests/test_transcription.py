@@ -1,11 +1,15 @@
 """Tests for voice transcription module."""
 
+import asyncio
 import builtins
 import sys
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import jarvis_mk1_lite.transcription as transcription_module
 from jarvis_mk1_lite.transcription import (
     TRANSCRIPTION_ERROR_PATTERNS,
     PremiumRequiredError,
@@ -18,6 +22,12 @@ from jarvis_mk1_lite.transcription import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_telethon_api() -> None:
+    """Drop the resolved Telethon names so each test sees its own mocked modules."""
+    transcription_module._telethon = None
+
+
 class TestIsErrorText:
     """Tests for _is_error_text helper function."""
 
@@ -55,6 +65,23 @@ class TestIsErrorText:
         assert _is_error_text("There was an error in my reasoning.") is False
         assert _is_error_text("I failed to mention something.") is False
 
+    def test_regex_fallback_without_pyahocorasick(self) -> None:
+        """Detection should use the regex when pyahocorasick is not installed."""
+        with patch.object(transcription_module, "_get_error_automaton", return_value=None):
+            assert _is_error_text("Sorry, ERROR DURING TRANSCRIPTION.") is True
+            assert _is_error_text("There was an error in my reasoning.") is False
+
+    def test_automaton_matches_patterns(self) -> None:
+        """The Aho-Corasick automaton should find every pattern, case-insensitively."""
+        pytest.importorskip("ahocorasick")
+        automaton = transcription_module._get_error_automaton()
+
+        assert automaton is not None
+        assert transcription_module._get_error_automaton() is automaton
+        for pattern in TRANSCRIPTION_ERROR_PATTERNS:
+            assert _is_error_text(f"Note: {pattern.upper()}!") is True
+        assert _is_error_text("There was an error in my reasoning.") is False
+
 
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
@@ -307,20 +334,11 @@ class TestGetTranscriber:
 
     def test_get_transcriber_no_credentials(self) -> None:
         """Test get_transcriber returns None without credentials."""
-        # Reset global instance
-        import jarvis_mk1_lite.transcription as transcription_module
-
-        transcription_module._transcriber = None
-
         result = get_transcriber()
         assert result is None
 
     def test_get_transcriber_partial_credentials(self) -> None:
         """Test get_transcriber returns None with partial credentials."""
-        import jarvis_mk1_lite.transcription as transcription_module
-
-        transcription_module._transcriber = None
-
         result = get_transcriber(api_id=12345)
         assert result is None
 
@@ -331,7 +349,7 @@ class TestGetTranscriber:
         """Test get_transcriber creates instance with full credentials."""
         import jarvis_mk1_lite.transcription as transcription_module
 
-        transcription_module._transcriber = None
+        transcription_module._build_transcriber.cache_clear()
 
         result = get_transcriber(
             api_id=12345,
@@ -343,24 +361,41 @@ class TestGetTranscriber:
         assert result.api_id == 12345
 
         # Cleanup
-        transcription_module._transcriber = None
+        transcription_module._build_transcriber.cache_clear()
 
     def test_get_transcriber_returns_existing(self) -> None:
-        """Test get_transcriber returns existing instance."""
+        """Test get_transcriber returns the existing instance for the same credentials."""
         import jarvis_mk1_lite.transcription as transcription_module
 
-        existing = VoiceTranscriber(
+        existing = get_transcriber(
             api_id=99999,
             api_hash="existing_hash",
             phone="+79999999999",
         )
-        transcription_module._transcriber = existing
 
-        result = get_transcriber()
+        result = get_transcriber(
+            api_id=99999,
+            api_hash="existing_hash",
+            phone="+79999999999",
+        )
         assert result is existing
 
         # Cleanup
-        transcription_module._transcriber = None
+        transcription_module._build_transcriber.cache_clear()
+
+    def test_get_transcriber_per_session(self) -> None:
+        """Test different session names get separate instances."""
+        import jarvis_mk1_lite.transcription as transcription_module
+
+        first = get_transcriber(api_id=1, api_hash="hash", phone="+1", session_name="a")
+        second = get_transcriber(api_id=1, api_hash="hash", phone="+1", session_name="b")
+
+        assert first is not second
+        assert first is not None and first.session_name == "a"
+        assert second is not None and second.session_name == "b"
+
+        # Cleanup
+        transcription_module._build_transcriber.cache_clear()
 
 
 class TestTranscriptionResultEquality:
@@ -427,6 +462,41 @@ class TestVoiceTranscriberProperties:
         )
         assert transcriber.session_exists() is True
 
+    def test_session_exists_cached_once_found(self, tmp_path: "Path") -> None:
+        """A found session file should not be stat-ed again; a missing one should."""
+        transcriber = VoiceTranscriber(
+            api_id=12345,
+            api_hash="test_hash",
+            phone="+79001234567",
+            session_name=str(tmp_path / "cached_session"),
+        )
+        assert transcriber.session_exists() is False
+
+        (tmp_path / "cached_session.session").touch()
+        assert transcriber.session_exists() is True
+
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            assert transcriber.session_exists() is True
+        assert transcriber.session_file_path is transcriber.session_file_path
+
+    @pytest.mark.asyncio
+    async def test_failed_authorization_invalidates_session_cache(self) -> None:
+        """is_authorized returning False should force the next check to stat."""
+        transcriber = VoiceTranscriber(
+            api_id=12345,
+            api_hash="test_hash",
+            phone="+79001234567",
+        )
+        transcriber._session_exists_cache = True
+        transcriber._client = MagicMock()
+        transcriber._client.is_user_authorized = AsyncMock(return_value=False)
+        transcriber._started = True
+
+        with patch.dict(sys.modules, {"telethon": MagicMock()}):
+            assert await transcriber.is_authorized() is False
+
+        assert transcriber._session_exists_cache is None
+
 
 class TestVoiceTranscriberIsAuthorized:
     """Tests for VoiceTranscriber.is_authorized() method (P2-TRANS-003)."""
@@ -576,13 +646,14 @@ class TestVoiceTranscriberTranscribeVoiceFile:
             },
         ):
             result = await transcriber.transcribe_voice_file(
-                voice_data=b"test voice data",
+                voice_data=b"test voice data" * 10,
                 duration=5,
             )
 
         assert result.text == "Transcribed from file"
         assert result.transcription_id == 11111
         mock_client.send_file.assert_called_once()
+        await asyncio.gather(*transcriber._pending_cleanup)
         mock_client.delete_messages.assert_called_once()
 
 
@@ -622,6 +693,7 @@ class TestPollTranscriptionAdvanced:
         with patch.dict(
             sys.modules,
             {
+                "telethon.errors": MagicMock(),
                 "telethon.tl": mock_tl,
                 "telethon.tl.functions": mock_functions,
             },
@@ -672,6 +744,7 @@ class TestPollTranscriptionAdvanced:
         with patch.dict(
             sys.modules,
             {
+                "telethon.errors": MagicMock(),
                 "telethon.tl": mock_tl,
                 "telethon.tl.functions": mock_functions,
             },
@@ -878,6 +951,7 @@ class TestTranscribeVoicePending:
         with patch.dict(
             sys.modules,
             {
+                "telethon.errors": MagicMock(),
                 "telethon.tl": mock_tl,
                 "telethon.tl.functions": mock_functions,
             },
@@ -949,7 +1023,7 @@ class TestTranscribeVoiceFileAdvanced:
         ):
             with pytest.raises(TranscriptionError, match="Transcription failed"):
                 await transcriber.transcribe_voice_file(
-                    voice_data=b"test voice data",
+                    voice_data=b"test voice data" * 10,
                     duration=5,
                 )
 
@@ -1020,7 +1094,7 @@ class TestTranscribeVoiceFileAdvanced:
             },
         ):
             result = await transcriber.transcribe_voice_file(
-                voice_data=b"test voice data",
+                voice_data=b"test voice data" * 10,
                 duration=5,
                 timeout=5.0,
                 poll_interval=0.1,
@@ -1029,6 +1103,7 @@ class TestTranscribeVoiceFileAdvanced:
         assert result.text == "Completed voice transcription"
         assert result.transcription_id == 88888
         # Verify cleanup was called
+        await asyncio.gather(*transcriber._pending_cleanup)
         mock_client.delete_messages.assert_called_once_with("me", [999])
 
 
@@ -1082,7 +1157,7 @@ class TestTranscribeVoiceFileErrors:
             },
         ):
             with pytest.raises(PremiumRequiredError, match="Premium"):
-                await transcriber.transcribe_voice_file(voice_data=b"test", duration=5)
+                await transcriber.transcribe_voice_file(voice_data=b"test" * 32, duration=5)
 
     @pytest.mark.asyncio
     async def test_transcribe_voice_file_cleanup_on_error(self) -> None:
@@ -1135,9 +1210,10 @@ class TestTranscribeVoiceFileErrors:
             },
         ):
             with pytest.raises(TranscriptionError):
-                await transcriber.transcribe_voice_file(voice_data=b"test", duration=5)
+                await transcriber.transcribe_voice_file(voice_data=b"test" * 32, duration=5)
 
             # Verify cleanup was called
+            await asyncio.gather(*transcriber._pending_cleanup)
             mock_client.delete_messages.assert_called_once_with("me", [999])
 
 
@@ -1218,6 +1294,9 @@ class TestVoiceTranscriberIsAuthorizedAdvanced:
         assert result is True
         mock_client_instance.connect.assert_called_once()
         mock_client_instance.is_user_authorized.assert_called_once()
+        # The probe client stays connected until stop()
+        mock_client_instance.disconnect.assert_not_called()
+        await transcriber.stop()
         mock_client_instance.disconnect.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1575,7 +1654,60 @@ class TestVoiceTranscriberLifecycle:
 
         mock_client_instance.connect.assert_called_once()
         mock_client_instance.is_user_authorized.assert_called_once()
-        mock_client_instance.disconnect.assert_called_once()
+        mock_client_instance.disconnect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_is_authorized_reuses_probe_client(self) -> None:
+        """Repeated is_authorized calls should connect only once."""
+        transcriber = VoiceTranscriber(
+            api_id=12345,
+            api_hash="test_hash",
+            phone="+79001234567",
+        )
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.connect = AsyncMock()
+        mock_client_instance.is_user_authorized = AsyncMock(return_value=True)
+        mock_client_instance.disconnect = AsyncMock()
+        mock_client_class = MagicMock(return_value=mock_client_instance)
+
+        mock_telethon = MagicMock()
+        mock_telethon.TelegramClient = mock_client_class
+
+        with (
+            patch.object(transcriber, "session_exists", return_value=True),
+            patch.dict(sys.modules, {"telethon": mock_telethon}),
+        ):
+            results = await asyncio.gather(*(transcriber.is_authorized() for _ in range(3)))
+
+        assert results == [True, True, True]
+        mock_client_class.assert_called_once()
+        mock_client_instance.connect.assert_called_once()
+        assert mock_client_instance.is_user_authorized.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_is_authorized_uses_started_client(self) -> None:
+        """A started transcriber should check through its own client."""
+        transcriber = VoiceTranscriber(
+            api_id=12345,
+            api_hash="test_hash",
+            phone="+79001234567",
+        )
+        transcriber._client = MagicMock()
+        transcriber._client.is_user_authorized = AsyncMock(return_value=True)
+        transcriber._started = True
+
+        mock_telethon = MagicMock()
+
+        with (
+            patch.object(transcriber, "session_exists", return_value=True),
+            patch.dict(sys.modules, {"telethon": mock_telethon}),
+        ):
+            result = await transcriber.is_authorized()
+
+        assert result is True
+        mock_telethon.TelegramClient.assert_not_called()
+        assert transcriber._probe_client is None
 
     @pytest.mark.asyncio
     async def test_lifecycle_is_authorized_connection_error(self) -> None:
@@ -1940,10 +2072,6 @@ class TestTranscriptionEdgeCases:
 
     def test_get_transcriber_with_missing_params(self) -> None:
         """get_transcriber should return None with missing params."""
-        import jarvis_mk1_lite.transcription as transcription_module
-
-        transcription_module._transcriber = None
-
         # Missing all params
         result = get_transcriber()
         assert result is None
@@ -1960,15 +2088,420 @@ class TestTranscriptionEdgeCases:
         """get_transcriber should return existing instance."""
         import jarvis_mk1_lite.transcription as transcription_module
 
-        existing = VoiceTranscriber(
-            api_id=99999,
-            api_hash="existing",
-            phone="+99999",
-        )
-        transcription_module._transcriber = existing
+        existing = get_transcriber(api_id=99999, api_hash="existing", phone="+99999")
 
-        result = get_transcriber()
+        result = get_transcriber(api_id=99999, api_hash="existing", phone="+99999")
         assert result is existing
 
         # Cleanup
-        transcription_module._transcriber = None
+        transcription_module._build_transcriber.cache_clear()
+
+
+class TestGetTelethon:
+    """Tests for the lazily resolved Telethon names."""
+
+    def test_resolved_once(self, mock_telethon_modules: dict[str, MagicMock]) -> None:
+        """Later calls should reuse the names bound on first use."""
+        with patch.dict(sys.modules, mock_telethon_modules):
+            first = transcription_module._get_telethon()
+
+        assert transcription_module._get_telethon() is first
+        assert (
+            first.TranscribeAudioRequest
+            is mock_telethon_modules["telethon.tl"].functions.messages.TranscribeAudioRequest
+        )
+
+    def test_import_error(self) -> None:
+        """A missing telethon should raise ImportError and cache nothing."""
+        with (
+            patch.dict(sys.modules, {"telethon.errors": None}),
+            pytest.raises(ImportError, match="telethon is required"),
+        ):
+            transcription_module._get_telethon()
+
+        assert transcription_module._telethon is None
+
+
+class TestTranscriptionCache:
+    """Tests for the transcribe_voice() result cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_uses_cache(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Second call for the same message should not hit Telegram."""
+        transcriber = make_started_transcriber()
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            first = await transcriber.transcribe_voice(peer=123, msg_id=456)
+            second = await transcriber.transcribe_voice(peer="123", msg_id=456)
+
+        assert second is first
+        assert transcriber._client.await_count == 1  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Entries older than the TTL should be fetched again."""
+        transcriber = make_started_transcriber(cache_ttl=10.0)
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            await transcriber.transcribe_voice(peer=123, msg_id=456)
+            # Age the entry past the TTL
+            result, cached_at = transcriber._cache[("123", 456)]
+            transcriber._cache[("123", 456)] = (result, cached_at - 11.0)
+            await transcriber.transcribe_voice(peer=123, msg_id=456)
+
+        assert transcriber._client.await_count == 2  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Least recently used entries should be evicted beyond cache_size."""
+        transcriber = make_started_transcriber(cache_size=2)
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            for msg_id in (1, 2, 3):
+                await transcriber.transcribe_voice(peer=123, msg_id=msg_id)
+
+        assert list(transcriber._cache) == [("123", 2), ("123", 3)]
+
+    @pytest.mark.asyncio
+    async def test_invalidate(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """invalidate() should force the next call to hit Telegram."""
+        transcriber = make_started_transcriber()
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            await transcriber.transcribe_voice(peer=123, msg_id=456)
+            transcriber.invalidate(123, 456)
+            await transcriber.transcribe_voice(peer=123, msg_id=456)
+
+        assert transcriber._client.await_count == 2  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_survives_restart(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+        tmp_path: Path,
+    ) -> None:
+        """A new transcriber sharing cache_db_path should reuse stored results."""
+        db_path = tmp_path / "transcriptions.db"
+        first = make_started_transcriber(cache_db_path=db_path)
+        second = make_started_transcriber(cache_db_path=db_path)
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            await first.transcribe_voice(peer=123, msg_id=456)
+            await first.stop()
+            result = await second.transcribe_voice(peer=123, msg_id=456)
+
+        assert result.text == "Mock transcribed text"
+        assert result.transcription_id == 99999
+        assert second._client.await_count == 0  # type: ignore[union-attr]
+        assert ("123", 456) in second._cache
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_ignores_expired_rows(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+        tmp_path: Path,
+    ) -> None:
+        """Rows past their wall-clock expiry should not be returned."""
+        db_path = tmp_path / "transcriptions.db"
+        first = make_started_transcriber(cache_db_path=db_path, cache_ttl=10.0)
+        second = make_started_transcriber(cache_db_path=db_path, cache_ttl=10.0)
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            with patch("jarvis_mk1_lite.transcription.time.time", return_value=1000.0):
+                await first.transcribe_voice(peer=123, msg_id=456)
+            with patch("jarvis_mk1_lite.transcription.time.time", return_value=1011.0):
+                await second.transcribe_voice(peer=123, msg_id=456)
+
+        assert second._client.await_count == 1  # type: ignore[union-attr]
+        await first.stop()
+        await second.stop()
+
+
+class TestTranscriptionSingleFlight:
+    """Tests for coalescing concurrent transcribe_voice() calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_request(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Concurrent calls for one message should send a single request."""
+        release = asyncio.Event()
+        mock_result = MagicMock(
+            text="Shared text", transcription_id=1, pending=False, trial_remains_num=None
+        )
+
+        async def slow_request(*args: Any) -> MagicMock:
+            await release.wait()
+            return mock_result
+
+        transcriber = make_started_transcriber(AsyncMock(side_effect=slow_request))
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            calls = [
+                asyncio.ensure_future(transcriber.transcribe_voice(peer=123, msg_id=456))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls)
+
+        assert [r.text for r in results] == ["Shared text"] * 3
+        assert transcriber._client.await_count == 1  # type: ignore[union-attr]
+        assert transcriber._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_callers(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """A failed shared request should raise for every waiting caller."""
+        transcriber = make_started_transcriber(AsyncMock(side_effect=RuntimeError("boom")))
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            results = await asyncio.gather(
+                transcriber.transcribe_voice(peer=123, msg_id=456),
+                transcriber.transcribe_voice(peer=123, msg_id=456),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, TranscriptionError) for r in results)
+        assert transcriber._client.await_count == 1  # type: ignore[union-attr]
+        assert transcriber._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Cancelling one waiter should leave the shared request running."""
+        release = asyncio.Event()
+        mock_result = MagicMock(
+            text="Survivor", transcription_id=1, pending=False, trial_remains_num=None
+        )
+
+        async def slow_request(*args: Any) -> MagicMock:
+            await release.wait()
+            return mock_result
+
+        transcriber = make_started_transcriber(AsyncMock(side_effect=slow_request))
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            first = asyncio.ensure_future(transcriber.transcribe_voice(peer=123, msg_id=456))
+            second = asyncio.ensure_future(transcriber.transcribe_voice(peer=123, msg_id=456))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            result = await second
+
+        assert first.cancelled()
+        assert result.text == "Survivor"
+
+
+class TestTranscribeVoiceFileCleanup:
+    """Tests for the background delete in transcribe_voice_file()."""
+
+    @pytest.mark.asyncio
+    async def test_result_returned_before_delete_finishes(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """The caller should not wait for the delete; stop() should drain it."""
+        release = asyncio.Event()
+
+        async def slow_delete(*args: Any) -> None:
+            await release.wait()
+
+        delete_messages = AsyncMock(side_effect=slow_delete)
+        transcriber = make_started_transcriber()
+        transcriber._client.delete_messages = delete_messages  # type: ignore[union-attr]
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            result = await transcriber.transcribe_voice_file(voice_data=b"voice" * 32, duration=5)
+
+        assert result.text == "Mock transcribed text"
+        assert len(transcriber._pending_cleanup) == 1
+
+        release.set()
+        await transcriber.stop()
+
+        delete_messages.assert_awaited_once_with("me", [12345])
+        assert not transcriber._pending_cleanup
+
+    @pytest.mark.asyncio
+    async def test_delete_failure_is_logged(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failed background delete should be logged, not raised."""
+        transcriber = make_started_transcriber()
+        transcriber._client.delete_messages = AsyncMock(  # type: ignore[union-attr]
+            side_effect=RuntimeError("gone")
+        )
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            await transcriber.transcribe_voice_file(voice_data=b"voice" * 32, duration=5)
+        await asyncio.gather(*transcriber._pending_cleanup)
+
+        assert "Failed to delete temp message: gone" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_short_voice_data_rejected_before_upload(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Too-short voice data should fail without touching Telegram."""
+        transcriber = make_started_transcriber()
+
+        with (
+            patch.dict(sys.modules, mock_telethon_modules),
+            pytest.raises(TranscriptionError, match="too short or empty"),
+        ):
+            await transcriber.transcribe_voice_file(voice_data=b"\x00" * 127, duration=5)
+
+        transcriber._client.send_file.assert_not_called()  # type: ignore[union-attr]
+        transcriber._client.assert_not_called()  # type: ignore[union-attr]
+        assert not transcriber._pending_cleanup
+
+    @pytest.mark.asyncio
+    async def test_default_voice_attrs_reused(
+        self,
+        mock_telethon_modules: dict[str, MagicMock],
+        make_started_transcriber: Callable[..., VoiceTranscriber],
+    ) -> None:
+        """Uploads without a duration should share one attributes list."""
+        transcriber = make_started_transcriber()
+
+        with patch.dict(sys.modules, mock_telethon_modules):
+            await transcriber.transcribe_voice_file(voice_data=b"voice" * 32)
+            await transcriber.transcribe_voice_file(voice_data=b"voice" * 32)
+            await transcriber.transcribe_voice_file(voice_data=b"voice" * 32, duration=5)
+
+        send_file = transcriber._client.send_file  # type: ignore[union-attr]
+        attrs = [call.kwargs["attributes"] for call in send_file.await_args_list]
+        assert attrs[0] is attrs[1]
+        assert attrs[2] is not attrs[0]
+        assert [attr[0].duration for attr in attrs] == [0, 0, 5]
+        await transcriber.stop()
+
+
+class TestTranscribeMany:
+    """Tests for VoiceTranscriber.transcribe_many()."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self) -> None:
+        """Should return results and exceptions in input order."""
+        transcriber = VoiceTranscriber(api_id=12345, api_hash="test_hash", phone="+79001234567")
+
+        async def fake_transcribe(peer: Any, msg_id: int, timeout: float) -> TranscriptionResult:
+            await asyncio.sleep(0.01 * (3 - msg_id))
+            if msg_id == 2:
+                raise TranscriptionError("boom")
+            return TranscriptionResult(text=f"text {msg_id}", transcription_id=msg_id)
+
+        with patch.object(transcriber, "transcribe_voice", side_effect=fake_transcribe):
+            results = await transcriber.transcribe_many([(1, 1), (1, 2), (1, 3)])
+
+        assert isinstance(results[0], TranscriptionResult)
+        assert results[0].text == "text 1"
+        assert isinstance(results[1], TranscriptionError)
+        assert isinstance(results[2], TranscriptionResult)
+        assert results[2].text == "text 3"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bound(self) -> None:
+        """Should not run more than `concurrency` transcriptions at once."""
+        transcriber = VoiceTranscriber(api_id=12345, api_hash="test_hash", phone="+79001234567")
+        in_flight = 0
+        peak = 0
+
+        async def fake_transcribe(peer: Any, msg_id: int, timeout: float) -> TranscriptionResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TranscriptionResult(text="ok", transcription_id=msg_id)
+
+        with patch.object(transcriber, "transcribe_voice", side_effect=fake_transcribe):
+            results = await transcriber.transcribe_many([(1, i) for i in range(10)], concurrency=3)
+
+        assert len(results) == 10
+        assert peak == 3
+
+
+class TestPollTranscriptionBackoff:
+    """Tests for exponential backoff in _poll_transcription()."""
+
+    @pytest.mark.asyncio
+    async def test_poll_delays_grow_until_cap(
+        self, mock_telethon_modules: dict[str, MagicMock]
+    ) -> None:
+        """Poll delays should grow by the backoff factor up to the cap."""
+        transcriber = VoiceTranscriber(api_id=12345, api_hash="test_hash", phone="+79001234567")
+        transcriber._started = True
+        pending = MagicMock(pending=True)
+        done = MagicMock(pending=False, text="done")
+        transcriber._client = AsyncMock(side_effect=[pending] * 5 + [done])
+
+        with (
+            patch.dict(sys.modules, mock_telethon_modules),
+            patch("jarvis_mk1_lite.transcription.random.uniform", return_value=0.0),
+            patch("jarvis_mk1_lite.transcription.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            result = await transcriber._poll_transcription(
+                peer="me", msg_id=1, transcription_id=2, timeout=60.0, poll_interval=2.0
+            )
+
+        assert result is done
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == pytest.approx([2.0, 3.0, 4.5, 5.0, 5.0, 5.0])
+
+    @pytest.mark.asyncio
+    async def test_pending_debug_log(
+        self, mock_telethon_modules: dict[str, MagicMock], caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Each still-pending poll should be logged at debug level."""
+        transcriber = VoiceTranscriber(api_id=12345, api_hash="test_hash", phone="+79001234567")
+        transcriber._started = True
+        pending = MagicMock(pending=True)
+        done = MagicMock(pending=False, text="done")
+        transcriber._client = AsyncMock(side_effect=[pending, done])
+
+        with (
+            patch.dict(sys.modules, mock_telethon_modules),
+            patch("jarvis_mk1_lite.transcription.asyncio.sleep", new_callable=AsyncMock),
+            caplog.at_level("DEBUG", logger="jarvis_mk1_lite.transcription"),
+        ):
+            await transcriber._poll_transcription(
+                peer="me", msg_id=1, transcription_id=42, timeout=60.0, poll_interval=0.1
+            )
+
+        pending_logs = [r.getMessage() for r in caplog.records if "Still pending" in r.msg]
+        assert pending_logs == ["Still pending... elapsed=0.0s, transcription_id=42"]